@@ -23,3 +23,5 @@ XRAY_SDK_MODULE: str = "aws_xray_sdk"
 XRAY_SDK_CORE_MODULE: str = "aws_xray_sdk.core"
 
 IDEMPOTENCY_DISABLED_ENV: str = "POWERTOOLS_IDEMPOTENCY_DISABLED"
+
+SERVICE_DISCOVERY_MAX_POOL_CONNECTIONS_ENV: str = "POWERTOOLS_SERVICE_DISCOVERY_MAX_POOL_CONNECTIONS"
@@ -2,6 +2,13 @@ import decimal
 import json
 import math
 
+try:
+    import orjson  # optional - several times faster than the standard library on large strings
+
+    HAS_ORJSON = True
+except ImportError:  # pragma: no cover
+    HAS_ORJSON = False
+
 
 class Encoder(json.JSONEncoder):
     """
@@ -14,3 +21,13 @@ class Encoder(json.JSONEncoder):
                 return math.nan
             return str(obj)
         return super().default(obj)
+
+
+def dumps(obj, sort_keys: bool = False) -> str:
+    """
+    Serializes obj to a compact JSON str - with orjson when it is installed, the standard library otherwise.
+    Both produce the same output for plain JSON types. sort_keys makes equal dicts serialize identically.
+    """
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS if sort_keys else None).decode()
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False, sort_keys=sort_keys)
@@ -3,10 +3,11 @@ from enum import Enum, auto
 from functools import wraps
 from inspect import isgeneratorfunction
 from time import sleep, time
-from typing import Callable, List, Optional
+from typing import Callable, List, Optional, Tuple, Type
 
 from aws_lambda_powertools.logging import Logger
 from aws_lambda_powertools.utilities.circuit_breaker.circuit_breaker_exceptions import CircuitBreakerException
+from aws_lambda_powertools.utilities.circuit_breaker.circuit_breaker_monitor import CircuitBreakerMonitor
 
 LOGGER = Logger(__name__)
 
@@ -21,6 +22,22 @@ class BaseCircuitBreaker(ABC):
     FAILURE_THRESHOLD = 5
     RECOVERY_TIMEOUT = 30
     SECONDS_TO_SECONDS_FACTOR = 1000
+    # True when the state changes only in this process - the circuit reports its transitions to the monitor
+    STATE_IN_MEMORY = False
+
+    __slots__ = (
+        "_last_failure",
+        "_failure_count",
+        "_failure_threshold",
+        "_recovery_timeout_in_milli",
+        "_circuit_breaker_monitor",
+        "_expected_exception",
+        "_fallback_function",
+        "_name",
+        "_state",
+        "_opened",
+        "logger",
+    )
 
     def __init__(
         self,
@@ -35,7 +52,7 @@ class BaseCircuitBreaker(ABC):
         Construct a circuit breaker.
         :param failure_threshold: break open after this many failures
         :param recovery_timeout: close after this many seconds
-        :param expected_exception: list of Exception types.
+        :param expected_exception: list of Exception types, or a single Exception type.
         :param name: name for this circuitbreaker
         :param fallback_function: called when the circuit is opened
            :return: Circuitbreaker instance
@@ -45,10 +62,14 @@ class BaseCircuitBreaker(ABC):
         self._failure_count = 0
         self._failure_threshold = failure_threshold or self.FAILURE_THRESHOLD
         self._recovery_timeout_in_milli = (recovery_timeout or self.RECOVERY_TIMEOUT) * self.SECONDS_TO_SECONDS_FACTOR
-        self._circuit_breaker_monitor = monitor
-
-        # create a list of exceptions. if None create a list of Exceptions as default
-        self._expected_exception: List[Exception] = expected_exception if expected_exception else [Exception]  # type: ignore[list-item]
+        self._circuit_breaker_monitor = monitor if monitor is not None else CircuitBreakerMonitor
+
+        # create a tuple of exceptions once, checked by a single issubclass call. if None create a tuple of Exception
+        if isinstance(expected_exception, type):
+            expected_exception = [expected_exception]
+        self._expected_exception: Tuple[Type[BaseException], ...] = (
+            tuple(expected_exception) if expected_exception else (Exception,)  # type: ignore[arg-type]
+        )
         self._fallback_function = fallback_function
         self._name = name
         self._state = State.CLOSED
@@ -148,8 +169,8 @@ class BaseCircuitBreaker(ABC):
             for el in func(*args, **kwargs):
                 yield el
 
-    def is_expected_failure(self, curr_exception: Exception) -> bool:
-        return any(issubclass(curr_exception, exc) for exc in self._expected_exception)  # type: ignore[arg-type]
+    def is_expected_failure(self, curr_exception: Type[BaseException]) -> bool:
+        return issubclass(curr_exception, self._expected_exception)
 
     def current_milli_time(self) -> int:
         return round(time() * self.SECONDS_TO_SECONDS_FACTOR)
@@ -1,16 +1,31 @@
+from itertools import chain
 from typing import Dict
 
 
 class CircuitBreakerMonitor:
     circuit_breakers: Dict = {}
+    # the in-memory circuits that opened - kept up to date by the circuits themselves, see mark_open/mark_closed
+    open_circuit_breakers: Dict = {}
+    # the circuits whose state is kept elsewhere (e.g. DynamoDB) - their state is always checked
+    remote_circuit_breakers: Dict = {}
 
     @classmethod
     def register(cls, circuit_breaker):
         cls.circuit_breakers[circuit_breaker.name] = circuit_breaker
+        if not circuit_breaker.STATE_IN_MEMORY:
+            cls.remote_circuit_breakers[circuit_breaker.name] = circuit_breaker
+
+    @classmethod
+    def mark_open(cls, circuit_breaker):
+        cls.open_circuit_breakers[circuit_breaker.name] = circuit_breaker
+
+    @classmethod
+    def mark_closed(cls, circuit_breaker):
+        cls.open_circuit_breakers.pop(circuit_breaker.name, None)
 
     @classmethod
     def all_closed(cls):
-        return len(list(cls.get_open())) == 0
+        return next(cls.get_open(), None) is None
 
     @classmethod
     def get_circuits(cls):
@@ -22,12 +37,17 @@ class CircuitBreakerMonitor:
 
     @classmethod
     def get_open(cls):
-        for circuit in cls.get_circuits():
+        # an opened in-memory circuit may be half-open by now
+        candidates = chain(list(cls.open_circuit_breakers.values()), list(cls.remote_circuit_breakers.values()))
+        for circuit in candidates:
             if circuit.opened:
                 yield circuit
 
     @classmethod
     def get_closed(cls):
-        for circuit in cls.get_circuits():
-            if circuit.closed:
+        for name, circuit in list(cls.circuit_breakers.items()):
+            if name in cls.remote_circuit_breakers:
+                if circuit.closed:
+                    yield circuit
+            elif name not in cls.open_circuit_breakers:
                 yield circuit
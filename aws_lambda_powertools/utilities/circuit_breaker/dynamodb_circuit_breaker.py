@@ -145,7 +145,7 @@ class DynamoDBCircuitBreaker(BaseCircuitBreaker):
                 "name": self.name,
                 "cb_state": State.CLOSED.value,
                 "opened": self._opened,
-                "expected_exception": str(self._expected_exception),
+                "expected_exception": str(list(self._expected_exception)),
                 "failure_count": self._failure_count,
                 "last_failure": "",
                 "failure_threshold": self._failure_threshold,
@@ -1,4 +1,5 @@
 from datetime import datetime, timedelta
+from time import monotonic_ns
 from typing import Callable, List, Optional
 
 from aws_lambda_powertools.logging import Logger
@@ -44,6 +45,11 @@ class InMemoryCircuitBreaker(BaseCircuitBreaker):
             raise ValueError('connection error')
     """
 
+    STATE_IN_MEMORY = True
+    NANOS_IN_MILLI = 1_000_000
+
+    __slots__ = ("_opened_ns", "_recovery_timeout_ns")
+
     def __init__(
         self,
         name: str,
@@ -56,6 +62,9 @@ class InMemoryCircuitBreaker(BaseCircuitBreaker):
     ):
         super().__init__(name, failure_threshold, recovery_timeout, expected_exception, fallback_function, monitor)
         self.logger = logger
+        # the state never leaves this process, so the open period is measured on the monotonic clock
+        self._opened_ns = monotonic_ns()
+        self._recovery_timeout_ns = self._recovery_timeout_in_milli * self.NANOS_IN_MILLI
 
     @property
     def state(self):
@@ -72,20 +81,17 @@ class InMemoryCircuitBreaker(BaseCircuitBreaker):
         The approximate datetime when the circuit breaker will try to recover
         :return: datetime
         """
-        self.logger.info(
-            f"Approximate time when the circuit breaker will return to half open: "
-            f"{datetime.utcnow() + timedelta(seconds=self.open_remaining)}"
-        )
-
-        return datetime.utcnow() + timedelta(seconds=self.open_remaining)
+        open_until = datetime.utcnow() + timedelta(milliseconds=self.open_remaining)
+        self.logger.info(f"Approximate time when the circuit breaker will return to half open: {open_until}")
+        return open_until
 
     @property
     def open_remaining(self):
         """
-        Number of seconds remaining, the circuit breaker stays in OPEN state
+        Number of milliseconds remaining, the circuit breaker stays in OPEN state
         :return: int
         """
-        remain = (self._opened + self._recovery_timeout_in_milli) - self.current_milli_time()
+        remain = (self._recovery_timeout_ns - (monotonic_ns() - self._opened_ns)) // self.NANOS_IN_MILLI
         self.logger.info(f"Remaining milliseconds until switch to half-open {remain}")
         return remain
 
@@ -126,6 +132,7 @@ class InMemoryCircuitBreaker(BaseCircuitBreaker):
         self._state = State.CLOSED
         self._last_failure = None
         self._failure_count = 0
+        self._circuit_breaker_monitor.mark_closed(self)
 
     def _call_failed(self):
         """
@@ -136,7 +143,8 @@ class InMemoryCircuitBreaker(BaseCircuitBreaker):
         if self._threshold_occurred():
             self.logger.warning(f"Failure count is above the threshold {self._failure_threshold}. moving state to open")
             self._state = State.OPEN
-            self._opened = self.current_milli_time()
+            self._opened_ns = monotonic_ns()
+            self._circuit_breaker_monitor.mark_open(self)
 
 
 def circuit(
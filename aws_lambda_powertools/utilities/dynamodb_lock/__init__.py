@@ -1,3 +1,3 @@
 from .client import DynamoDBLockClient  # noqa: F401
-from .db_lock import BaseDynamoDBLock  # noqa: F401
+from .db_lock import BaseDynamoDBLock, DynamoDBLockRecord, DynamoDBLockState  # noqa: F401
 from .exceptions import DynamoDBLockError  # noqa: F401
@@ -11,18 +11,23 @@ and fine-grained locking.
 """
 
 import datetime
+import heapq
+import itertools
 import threading
 import time
 import uuid
 from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
 from decimal import Decimal
-from typing import Dict, Optional
+from typing import Callable, Dict, List, Optional, Set, Tuple
 
+from boto3.dynamodb.types import TypeDeserializer, TypeSerializer
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
 from aws_lambda_powertools.logging.logger import Logger
 from aws_lambda_powertools.utilities.dynamodb_lock.consts import CONDITIONAL_CHECK_EXCEPTION, DEFAULT_TTL_ATTRIBUTE_NAME
-from aws_lambda_powertools.utilities.dynamodb_lock.db_lock import BaseDynamoDBLock, DynamoDBLock
+from aws_lambda_powertools.utilities.dynamodb_lock.db_lock import DynamoDBLock, DynamoDBLockRecord, DynamoDBLockState
 from aws_lambda_powertools.utilities.dynamodb_lock.exceptions import DynamoDBLockError
 
 LOGGER = Logger(__name__)
@@ -65,6 +70,13 @@ class DynamoDBLockClient:
             Defaults to a ThreadPoolExecutor with a maximum of 5 threads.
         logger: Logger
             The logger which will write logs from this object. Defaults: aws_lambda_powertools.logging.logger
+        dax_resource: boto3.ServiceResource
+            Optional DynamoDB Accelerator (DAX) resource, e.g. amazondax.AmazonDaxClient.resource(...).
+            When given, the lock reads done while polling in acquire_lock go through DAX, all writes
+            stay on the dynamodb_resource. Defaults to None.
+        read_cache_period: datetime.timedelta
+            Optional period to reuse the last read of a lock in acquire_lock - lets many threads polling
+            the same contested lock share a single read. Defaults to None (no caching).
 
     Example
     -----------
@@ -98,6 +110,35 @@ class DynamoDBLockClient:
     _DEFAULT_LEASE_DURATION = datetime.timedelta(seconds=30)
     _DEFAULT_EXPIRY_PERIOD = datetime.timedelta(hours=1)
     _DEFAULT_APP_CALLBACK_THREADPOOL_SIZE = 5
+    _DEFAULT_HEARTBEAT_THREADPOOL_SIZE = 10
+    _READ_CACHE_MAX_SIZE = 1024
+    # power of two - the shard index is a mask of the hash
+    _LOCK_SHARDS = 64
+    # for the recommended botocore config
+    _MIN_POOL_CONNECTIONS = 50
+    _MAX_RETRY_ATTEMPTS = 5
+    # botocore parameter (newer releases) returning the existing item when a conditional put fails
+    _RETURN_OLD_ITEM_PARAM = "ReturnValuesOnConditionCheckFailure"
+    _deserializer = TypeDeserializer()
+    _serializer = TypeSerializer()
+    # for acquire_locks - the BatchExecuteStatement limit, and the per-statement errors
+    _BATCH_SIZE = 25
+    # close() does not wait longer for a busy scheduler thread - the daemon thread dies with the process
+    _SCHEDULER_JOIN_TIMEOUT = 0.1
+    _BATCH_MAX_ATTEMPTS = 3
+    _BATCH_RETRY_BASE_DELAY = 0.05
+    _BATCH_LOCK_TAKEN_CODES = frozenset(("DuplicateItem", "ConditionalCheckFailed"))
+    # a heartbeat update failing on its version condition - from UpdateItem, and from a PartiQL statement
+    _LOCK_STOLEN_CODES = frozenset((CONDITIONAL_CHECK_EXCEPTION, "ConditionalCheckFailed"))
+    _BATCH_RETRYABLE_CODES = frozenset(
+        (
+            "RequestLimitExceeded",
+            "ProvisionedThroughputExceeded",
+            "TransactionConflict",
+            "ThrottlingError",
+            "InternalServerError",
+        )
+    )
     # for optional create-table method
     _DEFAULT_READ_CAPACITY = 5
     _DEFAULT_WRITE_CAPACITY = 5
@@ -124,6 +165,8 @@ class DynamoDBLockClient:
         expiry_period=_DEFAULT_EXPIRY_PERIOD,
         app_callback_executor=None,
         logger: Optional[Logger] = None,
+        dax_resource=None,
+        read_cache_period: Optional[datetime.timedelta] = None,
     ):
         """
         :param boto3.ServiceResource dynamodb_resource: mandatory argument
@@ -148,6 +191,16 @@ class DynamoDBLockClient:
                 app_callbacks in case of un-expected errors. Defaults to a ThreadPoolExecutor with a
                 maximum of 5 threads.
         :param Logger logger: you can pass logger in order to write logs
+        :param boto3.ServiceResource dax_resource: optional DAX resource to read the locks through.
+                As DAX passes strongly consistent reads through to DynamoDB, the reads through DAX are
+                eventually consistent; this is safe as every lock write is conditional on the
+                record_version_number (or on the lock not existing). Defaults to None.
+        :param datetime.timedelta read_cache_period: optional period to reuse the last read of a lock
+                while polling in acquire_lock. A stale read is self-correcting for the same reason as
+                above. Defaults to None (no caching).
+
+        For many concurrent locks, create the dynamodb_resource with get_boto_config() so the
+        heartbeats do not queue on botocore's default connection pool.
         """
         self.logger = logger if logger is not None else LOGGER
         self._uuid = uuid.uuid4().hex
@@ -156,6 +209,16 @@ class DynamoDBLockClient:
         self._partition_key_name = partition_key_name
         self._sort_key_name = sort_key_name
         self._ttl_attribute_name = ttl_attribute_name
+        self._reserved_cols = frozenset(
+            (
+                partition_key_name,
+                sort_key_name,
+                self._COL_OWNER_NAME,
+                self._COL_LEASE_DURATION,
+                self._COL_RECORD_VERSION_NUMBER,
+                ttl_attribute_name,
+            )
+        )
         self._owner_name = owner_name
         self._heartbeat_period = heartbeat_period
         self._safe_period = safe_period
@@ -165,141 +228,279 @@ class DynamoDBLockClient:
             max_workers=self._DEFAULT_APP_CALLBACK_THREADPOOL_SIZE,
             thread_name_prefix="DynamoDBLockClient-AC-" + self._uuid + "-",
         )
+        self._heartbeat_executor = ThreadPoolExecutor(
+            max_workers=self._DEFAULT_HEARTBEAT_THREADPOOL_SIZE,
+            thread_name_prefix="DynamoDBLockClient-HB-" + self._uuid + "-",
+        )
+        # no lock around it - single dict operations (setdefault, pop, values) are atomic under the GIL
         self._locks: Dict = {}
+        # shared by all the locks instead of a lock per DynamoDBLock - reentrant, as inline app_callbacks may
+        # release a lock while its shard is held
+        self._shards = [threading.RLock() for _ in range(self._LOCK_SHARDS)]
+        # the unique identifiers of the locks with a heartbeat in flight - changed under their shard locks
+        self._renewing: Set[str] = set()
         self._shutting_down = False
+        # lets acquire_lock() retry a lock released locally without the full wait - a release of a key is counted,
+        # and its waiters woken, only while some acquire_lock() call waits for that key
+        self._release_condition = threading.Condition()
+        self._release_waiters: Dict[str, int] = {}
+        self._release_counts: Dict[str, int] = {}
+        # min-heap of (deadline, seq, action, args) - run by the scheduler thread when the deadline elapses
+        self._schedule_heap: List = []
+        self._schedule_lock = threading.Lock()
+        self._schedule_seq = itertools.count()
+        self._timer = threading.Event()
+        # never cleared - unlike _shutting_down, which close() resets for the locks acquired after it
+        self._shutdown_event = threading.Event()
+        self._heartbeat_futures: List = []
 
         self._dynamodb_table = dynamodb_resource.Table(table_name)
-        self._start_heartbeat_sender_thread()
-        self._start_heartbeat_checker_thread()
+        self._put_returns_old_item = self._supports_return_values_on_condition_check_failure()
+        self._dax_table = dax_resource.Table(table_name) if dax_resource is not None else None
+        self._read_cache_period = read_cache_period.total_seconds() if read_cache_period else None
+        self._read_cache: Dict = {}
+        self._schedule_action(
+            time.monotonic() + self._heartbeat_period.total_seconds(), self._send_heartbeats_for_all_locks
+        )
+        self._start_scheduler_thread()
         self.logger.info("dynamodb client created", client=str(self))
 
-    def _start_heartbeat_sender_thread(self):
+    def _supports_return_values_on_condition_check_failure(self) -> bool:
+        """
+        Checks whether the installed botocore knows PutItem's ReturnValuesOnConditionCheckFailure parameter
+        """
+        try:
+            service_model = self._dynamodb_table.meta.client.meta.service_model
+            input_shape = service_model.operation_model("PutItem").input_shape
+            return isinstance(input_shape.members, dict) and self._RETURN_OLD_ITEM_PARAM in input_shape.members
+        except Exception:  # pylint: disable=broad-except
+            return False
+
+    def _get_shard_index(self, unique_identifier: str) -> int:
+        return hash(unique_identifier) & (self._LOCK_SHARDS - 1)
+
+    def _start_scheduler_thread(self):
         """
-        Creates and starts a daemon thread - that sends out periodic heartbeats for the active locks
+        Creates and starts a daemon thread - that sends the heartbeats and checks the locks when they are due
+        The Daemon Thread does not block the main thread from exiting and continues to run in the background
         """
-        self._heartbeat_sender_thread = threading.Thread(
-            name="DynamoDBLockClient-HS-" + self._uuid, target=self._send_heartbeat_loop
+        self._scheduler_thread = threading.Thread(
+            name="DynamoDBLockClient-SC-" + self._uuid, daemon=True, target=self._run_scheduler
         )
-        self._heartbeat_sender_thread.daemon = True
-        self._heartbeat_sender_thread.start()
-        self.logger.info("started the heartbeat-sender thread", thread=str(self._heartbeat_sender_thread))
+        self._scheduler_thread.start()
+        self.logger.info("started the scheduler thread", scheduler_thread=str(self._scheduler_thread))
 
-    def _send_heartbeat_and_sleep(
-        self, lock: DynamoDBLock, lock_index: int, start_time: float, avg_loop_time: float
-    ) -> None:
-        self._send_heartbeat(lock)
-        curr_loop_end_time = time.monotonic()
-        next_loop_start_time = start_time + lock_index * avg_loop_time
-        if curr_loop_end_time < next_loop_start_time:
-            time.sleep(next_loop_start_time - curr_loop_end_time)
-
-    def _wait_between_send_heartbeat_intervals(self, start_time: float, avg_loop_time: float) -> None:
-        end_time = time.monotonic()
-        next_start_time = start_time + self._heartbeat_period.total_seconds()
-        if end_time < next_start_time and not self._shutting_down:
-            time.sleep(next_start_time - end_time)
-        elif end_time > next_start_time + avg_loop_time:
-            self.logger.warning("sending heartbeats for all the locks took longer than the _heartbeat_period")
+    def _schedule_action(self, deadline: float, action: Callable, *args) -> None:
+        """
+        Schedules the action to run on the scheduler thread once time.monotonic() reaches the deadline.
 
-    def _wait_between_check_heartbeat_intervals(self, start_time: float) -> None:
-        end_time = time.monotonic()
-        next_start_time = start_time + self._heartbeat_period.total_seconds()
-        if end_time < next_start_time:
-            time.sleep(next_start_time - end_time)
-        else:
-            self.logger.warning("checking heartbeats for all the locks took longer than the _heartbeat_period")
+        :param float deadline: the time.monotonic() value after which the action is due
+        :param Callable action: the method to call
+        """
+        with self._schedule_lock:
+            seq = next(self._schedule_seq)
+            heapq.heappush(self._schedule_heap, (deadline, seq, action, args))
+            is_first = self._schedule_heap[0][1] == seq
+        if is_first:
+            # the scheduler thread may be sleeping till a later deadline
+            self._timer.set()
+
+    def _run_scheduler(self):
+        """
+        Runs the scheduled heartbeat actions - till the client is closed.
 
-    def _send_heartbeat_loop(self):
+        The thread sleeps on the _timer event till the nearest deadline (or till an earlier action is
+        scheduled, or the client is closed) - an idle client does not wake up on every tick.
         """
-        Keeps renewing the leases for the locks owned by this client - till the client is closed.
+        while not self._shutdown_event.is_set():
+            entry = None
+            timeout = None
+            with self._schedule_lock:
+                if self._schedule_heap:
+                    timeout = self._schedule_heap[0][0] - time.monotonic()
+                    if timeout <= 0:
+                        entry = heapq.heappop(self._schedule_heap)
+            if entry is None:
+                self._timer.wait(timeout)
+                self._timer.clear()
+                continue
+            _, _, action, args = entry
+            try:
+                action(*args)
+            except Exception as ex:  # pylint: disable=broad-except
+                self.logger.warning("a scheduled heartbeat action failed", exc_info=str(ex))
 
-        The method has a while loop that wakes up on a periodic basis (as defined by the _heartbeat_period)
-        and invokes the _send_heartbeat() method on each lock. It spreads the heartbeat-calls evenly over
-        the heartbeat window - to minimize the DynamoDB write throughput requirements.
+    def _send_heartbeats_for_all_locks(self) -> None:
+        """
+        Renews the leases for all the locks owned by this client, and schedules the next round
+        one _heartbeat_period later.
+
+        The heartbeats for all the locks are submitted to the heartbeat executor at once, so the heartbeat
+        round-trips overlap. A single lock is renewed with UpdateItem; more locks are renewed in batches of
+        up to 25 conditional PartiQL updates - one BatchExecuteStatement call per batch.
+        The scheduler thread does not wait for the round-trips; a round is skipped while the previous one
+        is still in flight.
+        A failing heartbeat is logged and does not affect the heartbeats of the other locks.
         """
-        while not self._shutting_down:
-            self.logger.info("starting a send_heartbeat loop")
-            start_time = time.monotonic()
-            locks = self._locks.copy()
+        start_time = time.monotonic()
+        self._schedule_action(start_time + self._heartbeat_period.total_seconds(), self._send_heartbeats_for_all_locks)
+        if not all(future.done() for future in self._heartbeat_futures):
+            self.logger.warning("sending heartbeats for all the locks took longer than the _heartbeat_period")
+            return
 
-            avg_loop_time = self._heartbeat_period.total_seconds() / len(locks) if locks else -1.0
-            loop_index = 1
-            for _uid, lock in locks.items():
-                self._send_heartbeat_and_sleep(lock, loop_index, start_time, avg_loop_time)
-                loop_index += 1
+        self.logger.info("sending heartbeats for all the locks")
+        locks = list(self._locks.values())
+        if len(locks) == 1:
+            futures = [self._heartbeat_executor.submit(self._send_heartbeat, locks[0])]
+        else:
+            futures = [
+                self._heartbeat_executor.submit(self._send_heartbeats, locks[start : start + self._BATCH_SIZE])
+                for start in range(0, len(locks), self._BATCH_SIZE)
+            ]
+        for future in futures:
+            future.add_done_callback(self._log_heartbeat_failure)
+        self._heartbeat_futures = futures
+
+    def _log_heartbeat_failure(self, future) -> None:
+        if future.exception() is not None:
+            self.logger.warning("failed to send a heartbeat", exc_info=str(future.exception()))
 
-            self.logger.info("finished the send_heartbeat loop")
-            self._wait_between_send_heartbeat_intervals(start_time, avg_loop_time)
+    def _send_heartbeat(self, lock: DynamoDBLock):
+        """
+        Renews the lease for the given lock - with one UpdateItem call.
 
-    def _update_lock_freshness(self, lock: DynamoDBLock) -> None:
+        :param DynamoDBLock lock: the lock instance that needs its lease to be renewed
         """
-        switches the record_version_number on the existing lock - which indicates owner is still alive
-        and all other clients should reset their timers.
+        self.logger.info("sending a DynamoDBLock heartbeat", lock_unique_identifier=lock.unique_identifier)
+        self._renew_leases([lock])
 
-        this method is called on a background thread, it uses the app_callback to let the
-        (lock requestor) app know when there are significant events in the lock lifecycle.
+    def _send_heartbeats(self, locks: List[DynamoDBLock]):
+        """
+        Renews the leases for a batch of up to 25 locks - with one BatchExecuteStatement call.
 
-        :param DynamoDBLock lock: the lock instance that needs its lease to be renewed
+        :param list locks: the lock instances that need their leases to be renewed
         """
-        new_record_version_number = str(uuid.uuid4())
-        new_expiry_time = int(time.time() + self._expiry_period.total_seconds())
+        self.logger.info("sending a batch of DynamoDBLock heartbeats", count=len(locks))
+        self._renew_leases(locks)
 
-        # first, try to update the database
-        self._update_lock_in_dynamodb(lock, new_record_version_number, new_expiry_time)
+    def _renew_leases(self, locks: List[DynamoDBLock]) -> None:
+        """
+        Renews the leases for the given locks - without holding their shard locks across the round-trip.
 
-        # if successful, update the in-memory lock representations
-        lock.record_version_number = new_record_version_number
-        lock.expiry_time = new_expiry_time
-        lock.last_updated_time = time.monotonic()
-        lock.status = DynamoDBLock.LOCKED
-        self.logger.info("successfully sent the heartbeat", lock_unique_identifier=lock.unique_identifier)
+        The state of every lock still owned and LOCKED is taken under the shard locks, which are released again
+        before the update is sent - so the locks that merely share a shard are not blocked meanwhile.
+        Every update is conditional on the record_version_number taken; the results are applied by
+        _apply_renewals, under the shard locks again.
 
-    def _send_heartbeat(self, lock: DynamoDBLock):
+        :param list locks: the lock instances that need their leases to be renewed
         """
-        Renews the lease for the given lock.
+        with ExitStack() as stack:
+            self._enter_shards(stack, locks)
+            # the ddb-locks might have been released while waiting for the shard locks
+            renewals = [
+                (lock, lock.state)
+                for lock in locks
+                if lock.unique_identifier in self._locks
+                and lock.status == DynamoDBLock.LOCKED
+                and lock.unique_identifier not in self._renewing
+            ]
+            self._renewing.update(lock.unique_identifier for lock, _ in renewals)
+        if not renewals:
+            self.logger.info("skipping the heartbeats as the locks are not locked any more")
+            return
 
-        :param DynamoDBLock lock: the lock instance that needs its lease to be renewed
+        new_expiry_time = int(time.time() + self._expiry_period.total_seconds())
+        new_record_version_numbers = [str(uuid.uuid4()) for _ in renewals]
+        codes: List[Optional[str]] = []
+        try:
+            if len(renewals) == 1:
+                lock, state = renewals[0]
+                codes = [
+                    self._update_lock_in_dynamodb(
+                        lock, state.record_version_number, new_record_version_numbers[0], new_expiry_time
+                    )
+                ]
+            else:
+                codes = self._update_locks_in_dynamodb(renewals, new_record_version_numbers, new_expiry_time)
+        finally:
+            self._apply_renewals(renewals, new_record_version_numbers, new_expiry_time, codes)
+        self.logger.info("successfully sent the heartbeats", count=len(renewals))
+
+    def _apply_renewals(
+        self,
+        renewals: List[Tuple[DynamoDBLock, DynamoDBLockState]],
+        new_record_version_numbers: List[str],
+        new_expiry_time: int,
+        codes: List[Optional[str]],
+    ) -> None:
         """
-        self.logger.info("sending a DynamoDBLock heartbeat", lock_unique_identifier=lock.unique_identifier)
-        with lock.thread_lock:
-            # the ddb-lock might have been released while waiting for the thread-lock
-            if lock.unique_identifier not in self._locks:
-                return
+        Applies the results of the heartbeat updates - under the shard locks of the renewed locks.
 
-            if lock.status != DynamoDBLock.LOCKED:
-                self.logger.info("skipping the heartbeat as the lock is not locked any more", status=lock.status)
-                return
+        A renewed lock is marked LOCKED again only if its state did not change during the round-trip. Otherwise
+        it just takes the renewed version, as the item holds it now - and a lock released meanwhile is deleted
+        again, as the delete of the release carried the old version and failed.
+        No codes - the update call failed as a whole - leaves the locks to the heartbeat checker.
+
+        :param list renewals: the (lock, state) pairs taken before the update
+        :param list new_record_version_numbers: the versions the locks were updated to
+        :param int new_expiry_time: the expiry_time the locks were updated to
+        :param list codes: the error code of every update - None for a renewed lock
+        """
+        orphaned = []
+        with ExitStack() as stack:
+            self._enter_shards(stack, [lock for lock, _ in renewals])
+            self._renewing.difference_update(lock.unique_identifier for lock, _ in renewals)
+            for (lock, state), new_record_version_number, code in zip(renewals, new_record_version_numbers, codes):
+                if code is None:
+                    if lock.state is state:
+                        lock.update_state(
+                            status=DynamoDBLock.LOCKED,
+                            last_updated_time=time.monotonic(),
+                            record_version_number=new_record_version_number,
+                            expiry_time=new_expiry_time,
+                        )
+                        continue
+                    lock.update_state(record_version_number=new_record_version_number, expiry_time=new_expiry_time)
+                    if lock.status == DynamoDBLock.RELEASED:
+                        orphaned.append(lock)
+                elif code in self._LOCK_STOLEN_CODES:
+                    # a release during the round-trip deleted the item - only an owned lock was stolen
+                    if self._locks.get(lock.unique_identifier) is lock:
+                        self.logger.warning(
+                            "lock stolen while sending heartbeat", lock_unique_identifier=lock.unique_identifier
+                        )
+                        self._invalidate_stolen_lock(lock)
+                else:
+                    # left to the heartbeat checker - same as a failed UpdateItem
+                    self.logger.warning(
+                        "failed to send a heartbeat", lock_unique_identifier=lock.unique_identifier, code=code
+                    )
+        if orphaned:
+            self.logger.info("deleting the locks released while sending heartbeats", count=len(orphaned))
+            self._delete_released_locks(orphaned)
 
-            self._update_lock_freshness(lock)
+    def _enter_shards(self, stack: ExitStack, locks: List[DynamoDBLock]) -> None:
+        # each shard once and in a consistent order - so concurrent batches can never deadlock on each other
+        for index in sorted({self._get_shard_index(lock.unique_identifier) for lock in locks}):
+            stack.enter_context(self._shards[index])
 
-    def _start_heartbeat_checker_thread(self):
+    def _schedule_heartbeat_check(self, lock: DynamoDBLock) -> None:
         """
-        Creates and starts a daemon thread - that checks that the locks are heartbeat-ing as expected
-        The Daemon Thread does not block the main thread from exiting and continues to run in the background
+        Schedules the check of the given lock for when its safe-period runs out - unless renewed by then.
         """
-        self._heartbeat_checker_thread = threading.Thread(
-            name="DynamoDBLockClient-HC-" + self._uuid, daemon=True, target=self._check_heartbeat_loop
-        )
-        self._heartbeat_checker_thread.start()
-        self.logger.info(
-            "started the heartbeat-checker thread", heartbeat_checker_thread=str(self._heartbeat_checker_thread)
+        self._schedule_action(
+            lock.last_updated_time + self._safe_period.total_seconds(), self._check_heartbeat_when_due, lock
         )
 
-    def _check_heartbeat_loop(self):
+    def _check_heartbeat_when_due(self, lock: DynamoDBLock) -> None:
         """
-        Keeps checking the locks to ensure that they are being updated as expected.
-        The method has a while loop that wakes up on a periodic basis and check heartbeat on each lock.
+        Checks the lock once its safe-period may have run out; while the lock is being renewed,
+        re-schedules the check for the end of the renewed safe-period instead.
         """
-        while not self._shutting_down:
-            self.logger.info("starting a check_heartbeat loop")
-            start_time = time.monotonic()
-            locks = self._locks.copy()
-
-            for _uid, lock in locks.items():
-                self._check_heartbeat(lock)
-
-            self.logger.info("finished the check_heartbeat loop")
-            self._wait_between_check_heartbeat_intervals(start_time)
+        if time.monotonic() >= lock.last_updated_time + self._safe_period.total_seconds():
+            self._check_heartbeat(lock)
+        if self._locks.get(lock.unique_identifier) is lock and lock.status == DynamoDBLock.LOCKED:
+            self._schedule_heartbeat_check(lock)
 
     def _check_heartbeat(self, lock: DynamoDBLock):
         """
@@ -315,42 +516,83 @@ class DynamoDBLockClient:
             over. In this case, the app_callback should try to expedite the processing,  either
             commit or rollback its changes quickly, and release the lock.
 
+        The lock state is read without taking the shard lock; it is only taken to move a lock into
+        danger - and only if no heartbeat or release replaced the state in the meantime.
+
         :param DynamoDBLock lock: the lock instance that needs its lease to be renewed
         """
         self.logger.info("checking a DynamoDBLock heartbeat", lock_unique_identifier=lock.unique_identifier)
 
-        with lock.thread_lock:
-            if lock.unique_identifier not in self._locks:
-                self.logger.info("the lock already released", status=lock.unique_identifier)
-                return
+        if lock.unique_identifier not in self._locks:
+            self.logger.info("the lock already released", status=lock.unique_identifier)
+            return
 
-            if lock.status != DynamoDBLock.LOCKED:
-                self.logger.info("skipping the check as the lock is not locked any more", status=lock.status)
-                return
+        state = lock.state
+        if state.status != DynamoDBLock.LOCKED:
+            self.logger.info("skipping the check as the lock is not locked any more", status=state.status)
+            return
 
-            safe_period_end_time = lock.last_updated_time + self._safe_period.total_seconds()
-            if time.monotonic() < safe_period_end_time:
-                self.logger.info("lock is safe", lock_unique_identifier=lock.unique_identifier)
-            else:
+        safe_period_end_time = state.last_updated_time + self._safe_period.total_seconds()
+        if time.monotonic() < safe_period_end_time:
+            self.logger.info("lock is safe", lock_unique_identifier=lock.unique_identifier)
+        else:
+            with lock._shard():
+                if lock.state is not state:
+                    self.logger.info("the lock changed while checking", lock_unique_identifier=lock.unique_identifier)
+                    return
                 self.logger.warning("lock is in danger", lock_unique_identifier=lock.unique_identifier)
                 lock.status = DynamoDBLock.IN_DANGER
-                self._call_app_callback(lock, DynamoDBLockError.LOCK_IN_DANGER)
-            self.logger.info("successfully checked the heartbeat", lock_unique_identifier=lock.unique_identifier)
+            self._call_app_callback(lock, DynamoDBLockError.LOCK_IN_DANGER)
+        self.logger.info("successfully checked the heartbeat", lock_unique_identifier=lock.unique_identifier)
 
     def _call_app_callback(self, lock: DynamoDBLock, code: str):
         """
         Utility function to route the app_callback through the thread-pool-executor
 
+        Locks without an app_callback are skipped, and callbacks flagged with ``_ddblock_inline = True``
+        are invoked on the calling thread - avoiding the executor round-trip for cheap callbacks
+        (e.g. a logger). Inline callbacks must be fast and must not block.
+
         :param DynamoDBLock lock: the lock for which the event is being fired
         :param str code: the notification event-type
         """
-        self._app_callback_executor.submit(lock.app_callback, code, lock)
+        app_callback = lock.app_callback
+        if app_callback is None:
+            return
+        if getattr(app_callback, "_ddblock_inline", False):
+            app_callback(code, lock)
+            return
+        self._app_callback_executor.submit(app_callback, code, lock)
 
     def _register_new_lock_local_memory(self, lock: DynamoDBLock) -> None:
         lock.status = DynamoDBLock.LOCKED
-        self._locks[lock.unique_identifier] = lock
+        existing_lock = self._locks.setdefault(lock.unique_identifier, lock)
+        if existing_lock is not lock:
+            # the new lock overwrote a stale lock of this client in the database - the stale one is gone
+            self.logger.warning("replacing a stale local lock", lock_unique_identifier=lock.unique_identifier)
+            # under the shard lock - like every other status change of an owned lock
+            with existing_lock._shard():
+                existing_lock.status = DynamoDBLock.INVALID
+                self._locks[lock.unique_identifier] = lock
+            self._call_app_callback(existing_lock, DynamoDBLockError.LOCK_STOLEN)
+        self._schedule_heartbeat_check(lock)
+        self._read_cache.pop((lock.partition_key, lock.sort_key), None)
         self.logger.info("successfully registered lock in memory", new_lock=str(lock))
 
+    def _create_new_lock(self, partition_key, sort_key, additional_attributes, app_callback) -> DynamoDBLock:
+        return DynamoDBLock(
+            partition_key=partition_key,
+            sort_key=sort_key,
+            owner_name=self._owner_name,
+            lease_duration=self._lease_duration.total_seconds(),
+            record_version_number=str(uuid.uuid4()),
+            expiry_time=int(time.time() + self._expiry_period.total_seconds()),
+            additional_attributes=additional_attributes,
+            app_callback=app_callback,
+            lock_client=self,
+            logger=self.logger,
+        )
+
     def _register_new_lock(self, lock: DynamoDBLock) -> DynamoDBLock:
         self.logger.info("no existing lock", lock_unique_identifier=lock.unique_identifier)
         self._add_new_lock_to_dynamodb(lock)
@@ -372,18 +614,36 @@ class DynamoDBLockClient:
     def _wait_between_acquire_lock_retry(
         self,
         lock_uid: str,
-        start_time: int,
-        retry_index: int,
-        retry_timeout_time: int,
+        start_time: float,
+        retry_timeout_time: float,
         retry_period: datetime.timedelta,
+        release_count: int,
     ) -> None:
         curr_loop_end_time = time.monotonic()
-        next_loop_start_time = start_time + retry_index * retry_period.total_seconds()
+        # the next retry_period boundary since start_time - an early wake-up does not move the schedule forward
+        period = retry_period.total_seconds()
+        next_loop_start_time = start_time + ((curr_loop_end_time - start_time) // period + 1) * period
         if next_loop_start_time > retry_timeout_time:
             raise DynamoDBLockError(DynamoDBLockError.ACQUIRE_TIMEOUT, f"acquire_lock() timed out: {lock_uid}")
-        elif next_loop_start_time > curr_loop_end_time:
-            self.logger.info("sleeping before a retry", lock_uid=lock_uid)
-            time.sleep(next_loop_start_time - curr_loop_end_time)
+        self.logger.info("sleeping before a retry", lock_uid=lock_uid)
+        # a release of this lock by this client since the attempt started wakes us up early
+        with self._release_condition:
+            self._release_condition.wait_for(
+                lambda: self._release_counts.get(lock_uid, 0) != release_count,
+                next_loop_start_time - curr_loop_end_time,
+            )
+
+    def _add_release_waiter(self, lock_uid: str) -> None:
+        with self._release_condition:
+            self._release_waiters[lock_uid] = self._release_waiters.get(lock_uid, 0) + 1
+
+    def _remove_release_waiter(self, lock_uid: str) -> None:
+        with self._release_condition:
+            waiters = self._release_waiters.pop(lock_uid) - 1
+            if waiters:
+                self._release_waiters[lock_uid] = waiters
+            else:
+                self._release_counts.pop(lock_uid, None)
 
     def acquire_lock(
         self,
@@ -398,14 +658,19 @@ class DynamoDBLockClient:
         Acquires a distributed DynamoDBLock for the given key(s).
 
         If the lock is currently held by a different client, then this client will keep retrying on
-        a periodic basis. In that case, a few different things can happen:
+        a periodic basis - or as soon as this client releases that lock. In that case, a few different
+        things can happen:
 
         1) The other client releases the lock
-        2) The other client dies, we will wait until the lock passed his expiry_time and we will try to acquire the lock
+        2) The other client dies, we will wait until the lock passed his lease_duration and we will try to
+            acquire the lock - or acquire it right away, if the lock is already past its expiry_time (TTL)
         3) This client goes over the max-retry-timeout-period
             the client failed to acquire the lock in the given time
         4) Race-condition amongst multiple lock-clients waiting to acquire released lock
 
+        When botocore supports ReturnValuesOnConditionCheckFailure, the first attempt is a conditional put -
+        a free lock is acquired in a single round-trip, and a taken lock is returned with the failed put.
+
         :param str partition_key: The primary lock identifier
         :param str sort_key: Forms a "composite identifier" along with the partition_key. Defaults to '-'
         :param datetime.timedelta retry_period: If the lock is not immediately available, how long
@@ -414,44 +679,53 @@ class DynamoDBLockClient:
                 how long should we keep trying before giving up and timing out?
                 Defaults to lease_duration + heartbeat_period.
         :param dict additional_attributes: Arbitrary application metadata to be stored with the lock
-        :param Callable app_callback: Callback function that can be used to notify the app of lock got an error
+        :param Callable app_callback: Callback function that can be used to notify the app of lock got an error.
+                Set ``app_callback._ddblock_inline = True`` to have a cheap callback invoked inline,
+                instead of through the app_callback_executor.
 
         :return: A distributed lock instance
         """
         self.logger.info("trying to acquire lock", partition_key=partition_key, sort_key=sort_key)
 
         # plug in default values as needed
-        if not retry_period:
-            retry_period = self._heartbeat_period
-        if not retry_timeout:
-            retry_timeout = self._lease_duration + self._heartbeat_period
+        retry_period = retry_period or self._heartbeat_period
+        retry_timeout = retry_timeout or self._lease_duration + self._heartbeat_period
 
-        new_lock = DynamoDBLock(
-            partition_key=partition_key,
-            sort_key=sort_key,
-            owner_name=self._owner_name,
-            lease_duration=self._lease_duration.total_seconds(),
-            record_version_number=str(uuid.uuid4()),
-            expiry_time=int(time.time() + self._expiry_period.total_seconds()),
-            additional_attributes=additional_attributes,
-            app_callback=app_callback,
-            lock_client=self,
-            logger=self.logger,
-        )
+        new_lock = self._create_new_lock(partition_key, sort_key, additional_attributes, app_callback)
+
+        self._add_release_waiter(new_lock.unique_identifier)
+        try:
+            return self._acquire_lock(new_lock, retry_period, retry_timeout)
+        finally:
+            self._remove_release_waiter(new_lock.unique_identifier)
 
+    def _acquire_lock(
+        self, new_lock: DynamoDBLock, retry_period: datetime.timedelta, retry_timeout: datetime.timedelta
+    ) -> DynamoDBLock:
+        partition_key, sort_key = new_lock.partition_key, new_lock.sort_key
         start_time = time.monotonic()
         retry_timeout_time = start_time + retry_timeout.total_seconds()
-        retry_count = 0
         last_record_version_number = None
         last_version_fetch_time = -1.0
+        expired_record_version_number = None
         while True:
             if self._shutting_down:
                 raise DynamoDBLockError(DynamoDBLockError.CLIENT_SHUTDOWN, "Client already shut down")
 
+            release_count = self._release_counts.get(new_lock.unique_identifier, 0)
             try:
                 new_lock.last_updated_time = time.monotonic()
                 new_lock.expiry_time = int(time.time() + self._expiry_period.total_seconds())
 
+                if expired_record_version_number is not None:
+                    # the failed put returned an expired lock - take it over without another read
+                    record_version_number, expired_record_version_number = expired_record_version_number, None
+                    return self._register_acquired_locked_after_release(new_lock, record_version_number)
+
+                if last_record_version_number is None and self._put_returns_old_item:
+                    # optimistic put - if the lock is taken, the existing record comes back with the failure
+                    return self._register_new_lock(new_lock)
+
                 self.logger.info(
                     "checking the database for existing owner", new_lock_unique_identifier=new_lock.unique_identifier
                 )
@@ -459,11 +733,16 @@ class DynamoDBLockClient:
 
                 if existing_lock is None:
                     return self._register_new_lock(new_lock)
+                elif self._is_expired(existing_lock):
+                    # the owner stopped heartbeat-ing long ago - no need to wait for the lease_duration
+                    return self._register_acquired_locked_after_release(new_lock, existing_lock.record_version_number)
                 else:
                     last_version_elapsed_time = time.monotonic() - last_version_fetch_time
                     if existing_lock.record_version_number == last_record_version_number:
                         if last_version_elapsed_time > existing_lock.lease_duration:
-                            return self._register_acquired_locked_after_release(new_lock, last_record_version_number)
+                            return self._register_acquired_locked_after_release(
+                                new_lock, existing_lock.record_version_number
+                            )
 
                     else:
                         self.logger.info(
@@ -480,24 +759,107 @@ class DynamoDBLockClient:
                         "someone else beat us to it - just log-it, sleep and retry",
                         new_lock_unique_identifier=new_lock.unique_identifier,
                     )
+                    existing_lock = self._get_lock_from_condition_check_failure(ex)
+                    if existing_lock is not None and self._is_expired(existing_lock):
+                        expired_record_version_number = existing_lock.record_version_number
+                        continue
+                    if existing_lock is not None and existing_lock.record_version_number != last_record_version_number:
+                        last_record_version_number = existing_lock.record_version_number
+                        last_version_fetch_time = time.monotonic()
                 else:
                     raise DynamoDBLockError(DynamoDBLockError.UNKNOWN, str(ex))
 
-            retry_count += 1
             self._wait_between_acquire_lock_retry(
                 lock_uid=new_lock.unique_identifier,
                 start_time=start_time,
-                retry_index=retry_count,
                 retry_timeout_time=retry_timeout_time,
                 retry_period=retry_period,
+                release_count=release_count,
             )
 
+    @staticmethod
+    def _is_expired(lock_record: DynamoDBLockRecord) -> bool:
+        """
+        Checks whether the lock is past its expiry_time - the TTL the owner pushes forward with every heartbeat.
+        DynamoDB deletes such items eventually, but may take a while to do so.
+        """
+        return lock_record.expiry_time < int(time.time())
+
+    def acquire_locks(
+        self,
+        keys: List[Tuple[str, str]],
+        additional_attributes=None,
+        app_callback=None,
+    ) -> List[DynamoDBLock]:
+        """
+        Tries to acquire the distributed locks for many keys at once - without waiting for the taken ones.
+
+        The locks are written with PartiQL INSERT statements, up to 25 per BatchExecuteStatement call.
+        An INSERT fails when the item already exists, so a taken lock is skipped - never overwritten.
+        Statements failing on throttling are retried a few times. Use acquire_lock() to wait for a taken lock.
+        The locks of a batch are owned - and heartbeated - as soon as it is written; on an error, the locks
+        acquired so far are released again before the error is raised.
+
+        :param list keys: The (partition_key, sort_key) tuples of the locks to acquire
+        :param dict additional_attributes: Arbitrary application metadata to be stored with every lock
+        :param Callable app_callback: Callback function that can be used to notify the app of lock got an error.
+
+        :return: The acquired locks, in the order of the keys
+        """
+        if self._shutting_down:
+            raise DynamoDBLockError(DynamoDBLockError.CLIENT_SHUTDOWN, "Client already shut down")
+
+        self.logger.info("trying to acquire locks", count=len(keys))
+        new_locks = [self._create_new_lock(pk, sk, additional_attributes, app_callback) for pk, sk in keys]
+        pending = new_locks
+        acquired = set()
+        try:
+            for attempt in range(self._BATCH_MAX_ATTEMPTS):
+                if attempt:
+                    time.sleep(self._BATCH_RETRY_BASE_DELAY * 2**attempt)
+                retry = []
+                for start in range(0, len(pending), self._BATCH_SIZE):
+                    batch = pending[start : start + self._BATCH_SIZE]
+                    inserted = []
+                    failure_code = None
+                    for lock, code in zip(batch, self._insert_locks_to_dynamodb(batch)):
+                        if code is None:
+                            inserted.append(lock)
+                        elif code in self._BATCH_RETRYABLE_CODES:
+                            retry.append(lock)
+                        elif code not in self._BATCH_LOCK_TAKEN_CODES:
+                            failure_code = code
+                    # registered right away - the heartbeats keep them alive while the next batches are sent
+                    self._register_new_locks_local_memory(inserted)
+                    acquired.update(inserted)
+                    if failure_code is not None:
+                        raise DynamoDBLockError(DynamoDBLockError.UNKNOWN, f"acquire_locks() failed: {failure_code}")
+                pending = retry
+                if not pending:
+                    break
+        except Exception:
+            # all or nothing on errors - the locks inserted so far are released again
+            self.logger.warning("failed to acquire locks, releasing the acquired ones", count=len(acquired))
+            self._release_locks([lock for lock in new_locks if lock in acquired])
+            raise
+        if pending:
+            self.logger.warning("giving up on throttled locks", count=len(pending))
+
+        new_locks = [lock for lock in new_locks if lock in acquired]
+        self.logger.info("successfully acquired locks", count=len(new_locks))
+        return new_locks
+
+    def _register_new_locks_local_memory(self, locks: List[DynamoDBLock]) -> None:
+        for lock in locks:
+            lock.status = DynamoDBLock.LOCKED
+            self._read_cache.pop((lock.partition_key, lock.sort_key), None)
+        self._locks.update((lock.unique_identifier, lock) for lock in locks)
+        for lock in locks:
+            self._schedule_heartbeat_check(lock)
+
     def get_lock_status(self, lock_id: str) -> Optional[str]:
-        if lock_id in self._locks:
-            lock = self._locks.get(lock_id)
-            if lock:
-                return lock.status
-        return None
+        lock = self._locks.get(lock_id)
+        return lock.status if lock is not None else None
 
     def release_lock(self, lock, best_effort=True):
         """
@@ -508,18 +870,32 @@ class DynamoDBLockClient:
         """
         self.logger.info("releasing the lock", lock=str(lock))
 
-        with lock.thread_lock:
+        with lock._shard():
             if lock.status not in [DynamoDBLock.LOCKED, DynamoDBLock.IN_DANGER]:
                 self.logger.info("skipping the release as the lock is not locked any more", lock_status=lock.status)
                 return
 
-            if lock.unique_identifier in self._locks:
-                lock.status = DynamoDBLock.RELEASED
-                self._locks.pop(lock.unique_identifier)  # will stop send heartbeats
-                self._delete_lock_from_dynamodb(lock, best_effort)
-                self.logger.info("successfully released the lock", lock_unique_identifier=lock.unique_identifier)
+            if self._locks.pop(lock.unique_identifier, None) is None:  # will stop send heartbeats
+                return
+            lock.status = DynamoDBLock.RELEASED
+            # a heartbeat in flight may renew the version first - it deletes the lock again once it sees the release
+            renewing = lock.unique_identifier in self._renewing
+
+        self._delete_lock_from_dynamodb(lock, best_effort, renewing)
+        self._read_cache.pop((lock.partition_key, lock.sort_key), None)
+        self._notify_locks_released([lock])
+        self.logger.info("successfully released the lock", lock_unique_identifier=lock.unique_identifier)
+
+    def _notify_locks_released(self, locks: List[DynamoDBLock]) -> None:
+        with self._release_condition:
+            waited_for = [lock.unique_identifier for lock in locks if lock.unique_identifier in self._release_waiters]
+            if not waited_for:
+                return
+            for lock_uid in waited_for:
+                self._release_counts[lock_uid] = self._release_counts.get(lock_uid, 0) + 1
+            self._release_condition.notify_all()
 
-    def _delete_lock_from_dynamodb(self, lock: DynamoDBLock, best_effort: bool) -> None:
+    def _delete_lock_from_dynamodb(self, lock: DynamoDBLock, best_effort: bool, renewing: bool = False) -> None:
         try:
             self._dynamodb_table.delete_item(
                 Key={self._partition_key_name: lock.partition_key, self._sort_key_name: lock.sort_key},
@@ -541,11 +917,22 @@ class DynamoDBLockClient:
                     exc_info=str(ex),
                 )
             elif ex.response["Error"]["Code"] == CONDITIONAL_CHECK_EXCEPTION:
+                if renewing:
+                    # the heartbeat in flight renewed the version first - it deletes the lock once it is back
+                    self.logger.info("lock renewed while releasing", lock_unique_identifier=lock.unique_identifier)
+                    return
                 raise DynamoDBLockError(DynamoDBLockError.LOCK_STOLEN, "Lock was stolen by someone else") from ex
             else:
                 raise DynamoDBLockError(DynamoDBLockError.UNKNOWN, str(ex)) from ex
 
-    def _update_lock_in_dynamodb(self, lock: DynamoDBLock, new_record_version: str, expiry_time: int) -> None:
+    def _update_lock_in_dynamodb(
+        self, lock: DynamoDBLock, old_record_version: str, new_record_version: str, expiry_time: int
+    ) -> Optional[str]:
+        """
+        Updates the lock with one UpdateItem call - only if its version is still old_record_version.
+
+        :return: The error code of a failed condition - None for an updated lock
+        """
         try:
             self._dynamodb_table.update_item(
                 Key={self._partition_key_name: lock.partition_key, self._sort_key_name: lock.sort_key},
@@ -558,97 +945,115 @@ class DynamoDBLockClient:
                     "#et": self._ttl_attribute_name,
                 },
                 ExpressionAttributeValues={
-                    ":old_rvn": lock.record_version_number,
+                    ":old_rvn": old_record_version,
                     ":new_rvn": new_record_version,
                     ":new_et": expiry_time,
                 },
             )
         except ClientError as ex:
             if ex.response["Error"]["Code"] == CONDITIONAL_CHECK_EXCEPTION:
-                # someone else stole our lock!
-                self.logger.exception(
-                    "LockStolenError while sending heartbeat", lock_unique_identifier=lock.unique_identifier
-                )
-                lock.status = DynamoDBLock.INVALID
-                self._locks.pop(lock.unique_identifier)
-                self._call_app_callback(
-                    lock, DynamoDBLockError.LOCK_STOLEN
-                )  # the app should abort its processing; no need to release
-            else:
-                self.logger.exception(
-                    "ClientError while sending heartbeat",
-                    lock_unique_identifier=lock.unique_identifier,
-                    exc_info=str(ex),
-                )
-                raise DynamoDBLockError(code="UNKNOWN", message="ClientError while sending heartbeat") from ex
-
-    def _add_new_lock_record_to_dynamodb(self, lock: DynamoDBLock):
-        """
-        :param DynamoDBLock lock: The lock instance that needs to be added to the database.
-        """
-        try:
-            self.logger.debug("adding a new lock", lock=str(lock))
-            self._dynamodb_table.put_item(
-                Item=self._get_record_from_lock(lock),
-                ConditionExpression="NOT(attribute_exists(#pk) AND attribute_exists(#sk))",
-                ExpressionAttributeNames={
-                    "#pk": self._partition_key_name,
-                    "#sk": self._sort_key_name,
-                },
+                return CONDITIONAL_CHECK_EXCEPTION
+            self.logger.exception(
+                "ClientError while sending heartbeat",
+                lock_unique_identifier=lock.unique_identifier,
+                exc_info=str(ex),
             )
-        except ClientError as ex:
-            if ex.response["Error"]["Code"] == CONDITIONAL_CHECK_EXCEPTION:
-                # someone else stole our lock!
-                self.logger.exception(
-                    "LockStolenError while sending heartbeat", lock_unique_identifier=lock.unique_identifier
-                )
-                lock.status = DynamoDBLock.INVALID
-                self._locks.pop(lock.unique_identifier)
-                self._call_app_callback(
-                    lock, DynamoDBLockError.LOCK_STOLEN
-                )  # the app should abort its processing; no need to release
-            else:
-                self.logger.exception(
-                    "ClientError while sending heartbeat",
-                    lock_unique_identifier=lock.unique_identifier,
-                    exc_info=str(ex),
-                )
-                raise DynamoDBLockError(code="UNKNOWN", message="ClientError while sending heartbeat") from ex
+            raise DynamoDBLockError(code="UNKNOWN", message="ClientError while sending heartbeat") from ex
+        return None
 
-    def _get_record_from_lock(self, lock: BaseDynamoDBLock) -> Dict:
+    def _invalidate_stolen_lock(self, lock: DynamoDBLock) -> None:
+        lock.status = DynamoDBLock.INVALID
+        self._locks.pop(lock.unique_identifier, None)
+        # the app should abort its processing; no need to release
+        self._call_app_callback(lock, DynamoDBLockError.LOCK_STOLEN)
+
+    def _update_locks_in_dynamodb(
+        self, renewals: List[Tuple[DynamoDBLock, DynamoDBLockState]], new_record_versions: List[str], expiry_time: int
+    ) -> List[Optional[str]]:
         """
-        Converts a BaseDynamoDBLock  instance to a DynamoDB 'Item' dict
+        Updates a batch of locks with one BatchExecuteStatement call - each only if its version is still the one
+        in the given state.
 
-        :param BaseDynamoDBLock lock: The lock instance to be serialized.
+        :return: The error code of every statement - None for an updated lock
         """
-        self.logger.debug("get item from lock", lock=str(lock))
-        item = lock.additional_attributes.copy()
-        item.update(
+        statement = 'UPDATE "%s" SET "%s" = ? SET "%s" = ? WHERE "%s" = ? AND "%s" = ? AND "%s" = ?' % (
+            self._table_name,
+            self._COL_RECORD_VERSION_NUMBER,
+            self._ttl_attribute_name,
+            self._partition_key_name,
+            self._sort_key_name,
+            self._COL_RECORD_VERSION_NUMBER,
+        )
+        serialize = self._serializer.serialize
+        statements = [
             {
-                self._partition_key_name: lock.partition_key,
-                self._sort_key_name: lock.sort_key,
-                self._COL_OWNER_NAME: lock.owner_name,
-                self._COL_LEASE_DURATION: Decimal.from_float(lock.lease_duration),
-                self._COL_RECORD_VERSION_NUMBER: lock.record_version_number,
-                self._ttl_attribute_name: lock.expiry_time,
+                "Statement": statement,
+                "Parameters": [
+                    serialize(new_record_version),
+                    serialize(expiry_time),
+                    serialize(lock.partition_key),
+                    serialize(lock.sort_key),
+                    serialize(state.record_version_number),
+                ],
             }
-        )
-        return item
+            for (lock, state), new_record_version in zip(renewals, new_record_versions)
+        ]
+        try:
+            result = self._dynamodb_table.meta.client.batch_execute_statement(Statements=statements)
+        except ClientError as ex:
+            self.logger.exception("ClientError while sending heartbeats", exc_info=str(ex))
+            raise DynamoDBLockError(code="UNKNOWN", message="ClientError while sending heartbeats") from ex
+        return [response.get("Error", {}).get("Code") for response in result["Responses"]]
 
     def _get_lock_from_dynamodb(self, partition_key, sort_key):
         """
         Loads the lock from the database - or returns None if not available.
 
-        :rtype: BaseDynamoDBLock
+        Reads through DAX when a dax_resource was given, and reuses a read younger than the
+        read_cache_period when one was given.
+
+        :rtype: DynamoDBLockRecord
         """
+        cache_key = (partition_key, sort_key)
+        if self._read_cache_period is not None:
+            cached = self._read_cache.get(cache_key)
+            if cached is not None and time.monotonic() - cached[0] < self._read_cache_period:
+                self.logger.debug("using the cached lock for", partition_key=partition_key, sort_key=sort_key)
+                return cached[1]
+
         self.logger.debug("getting the lock from dynamodb for", partition_key=partition_key, sort_key=sort_key)
-        result = self._dynamodb_table.get_item(
-            Key={self._partition_key_name: partition_key, self._sort_key_name: sort_key}, ConsistentRead=True
-        )
-        if "Item" in result:
-            return self._get_lock_from_item(result["Item"])
+        read_time = time.monotonic()
+        key = {self._partition_key_name: partition_key, self._sort_key_name: sort_key}
+        if self._dax_table is not None:
+            result = self._dax_table.get_item(Key=key)
         else:
+            result = self._dynamodb_table.get_item(Key=key, ConsistentRead=True)
+        lock = self._get_lock_from_item(result["Item"]) if "Item" in result else None
+
+        if self._read_cache_period is not None:
+            if len(self._read_cache) >= self._READ_CACHE_MAX_SIZE:
+                self._read_cache.clear()
+            self._read_cache[cache_key] = (read_time, lock)
+        return lock
+
+    def _put_item_kwargs(self) -> Dict:
+        """
+        Extra put_item arguments - asks for the existing item on a failed condition when botocore supports it
+        """
+        return {self._RETURN_OLD_ITEM_PARAM: "ALL_OLD"} if self._put_returns_old_item else {}
+
+    def _get_lock_from_condition_check_failure(self, ex: ClientError) -> Optional[DynamoDBLockRecord]:
+        """
+        Extracts the existing lock from a failed conditional put - or returns None if it was not returned.
+
+        :param ClientError ex: The ConditionalCheckFailedException raised by put_item
+        :rtype: DynamoDBLockRecord
+        """
+        item = ex.response.get("Item") or ex.response["Error"].get("Item")
+        if not item:
             return None
+        # the error response is not converted by the boto3 resource layer, so the item is in the wire format
+        return self._get_lock_from_item({k: self._deserializer.deserialize(v) for k, v in item.items()})
 
     def _add_new_lock_to_dynamodb(self, lock):
         """
@@ -658,6 +1063,7 @@ class DynamoDBLockClient:
         """
         self.logger.debug("adding a new lock", lock=str(lock))
         self._dynamodb_table.put_item(
+            **self._put_item_kwargs(),
             Item=self._get_item_from_lock(lock),
             ConditionExpression="NOT(attribute_exists(#pk) AND attribute_exists(#sk))",
             ExpressionAttributeNames={
@@ -666,6 +1072,30 @@ class DynamoDBLockClient:
             },
         )
 
+    def _insert_locks_to_dynamodb(self, locks: List[DynamoDBLock]) -> List[Optional[str]]:
+        """
+        Inserts new locks into the database with one BatchExecuteStatement call - an INSERT fails if the lock exists.
+
+        :param list locks: Up to 25 DynamoDBLock instances that need to be added to the database.
+        :return: The error code of every statement - None for an inserted lock
+        """
+        self.logger.debug("inserting new locks", count=len(locks))
+        statements = []
+        for lock in locks:
+            item = self._get_item_from_lock(lock)
+            names = ", ".join("'%s': ?" % name.replace("'", "''") for name in item)
+            statements.append(
+                {
+                    "Statement": 'INSERT INTO "%s" VALUE {%s}' % (self._table_name, names),
+                    "Parameters": [self._serializer.serialize(value) for value in item.values()],
+                }
+            )
+        try:
+            result = self._dynamodb_table.meta.client.batch_execute_statement(Statements=statements)
+        except ClientError as ex:
+            raise DynamoDBLockError(DynamoDBLockError.UNKNOWN, str(ex))
+        return [response.get("Error", {}).get("Code") for response in result["Responses"]]
+
     def _overwrite_existing_lock_in_dynamodb(self, lock, record_version_number):
         """
         Overwrites an existing lock in the database - while checking that the version has not changed.
@@ -677,6 +1107,7 @@ class DynamoDBLockClient:
             "overwriting existing-rvn with new lock", record_version_number=record_version_number, lock=str(lock)
         )
         self._dynamodb_table.put_item(
+            **self._put_item_kwargs(),
             Item=self._get_item_from_lock(lock),
             ConditionExpression="attribute_exists(#pk) AND attribute_exists(#sk) AND #rvn = :old_rvn",
             ExpressionAttributeNames={
@@ -691,23 +1122,22 @@ class DynamoDBLockClient:
 
     def _get_lock_from_item(self, item):
         """
-        Converts a DynamoDB 'Item' dict to a BaseDynamoDBLock instance
+        Converts a DynamoDB 'Item' dict to a read-only DynamoDBLockRecord - the item is left untouched
 
         :param dict item: The DynamoDB 'Item' dict object to be de-serialized.
-        :rtype: BaseDynamoDBLock
+        :rtype: DynamoDBLockRecord
         """
         self.logger.debug("get lock from item", item=str(item))
-        lock = BaseDynamoDBLock(
-            partition_key=item.pop(self._partition_key_name),
-            sort_key=item.pop(self._sort_key_name),
-            owner_name=item.pop(self._COL_OWNER_NAME),
-            lease_duration=float(item.pop(self._COL_LEASE_DURATION)),
-            record_version_number=item.pop(self._COL_RECORD_VERSION_NUMBER),
-            expiry_time=int(item.pop(self._ttl_attribute_name)),
-            additional_attributes=item,
-            logger=self.logger,
+        reserved_cols = self._reserved_cols
+        return DynamoDBLockRecord(
+            partition_key=item[self._partition_key_name],
+            sort_key=item[self._sort_key_name],
+            owner_name=item[self._COL_OWNER_NAME],
+            lease_duration=float(item[self._COL_LEASE_DURATION]),
+            record_version_number=item[self._COL_RECORD_VERSION_NUMBER],
+            expiry_time=int(item[self._ttl_attribute_name]),
+            additional_attributes={k: v for k, v in item.items() if k not in reserved_cols},
         )
-        return lock
 
     def _get_item_from_lock(self, lock):
         """
@@ -732,17 +1162,97 @@ class DynamoDBLockClient:
 
     def _release_all_locks(self):
         """
-        Iterates over all the locks and releases each one.
+        Releases all the locks - with one BatchExecuteStatement call per batch of up to 25 locks.
         """
         self.logger.info("releasing all locks", locks=len(self._locks))
-        for _uid, lock in self._locks.copy().items():
-            self.release_lock(lock, best_effort=True)
+        locks = list(self._locks.values())
+        self._release_locks(locks)
+        for lock in locks:
             self._call_app_callback(lock, DynamoDBLockError.LOCK_STOLEN)
 
+    def _release_locks(self, locks: List[DynamoDBLock]) -> None:
+        """
+        Releases the locks on a best-effort basis - failed deletes are logged, the items will expire.
+
+        :param list locks: DynamoDBLock instances to release - deleted in batches of up to 25
+        """
+        released = []
+        for start in range(0, len(locks), self._BATCH_SIZE):
+            batch = locks[start : start + self._BATCH_SIZE]
+            with ExitStack() as stack:
+                self._enter_shards(stack, batch)
+                for lock in batch:
+                    if lock.status in (DynamoDBLock.LOCKED, DynamoDBLock.IN_DANGER):
+                        if self._locks.pop(lock.unique_identifier, None) is not None:
+                            lock.status = DynamoDBLock.RELEASED
+                            released.append(lock)
+        if not released:
+            return
+
+        self._delete_released_locks(released)
+        for lock in released:
+            self._read_cache.pop((lock.partition_key, lock.sort_key), None)
+        self._notify_locks_released(released)
+        self.logger.info("successfully released the locks", count=len(released))
+
+    def _delete_released_locks(self, locks: List[DynamoDBLock]) -> None:
+        """
+        Deletes locks no longer owned on a best-effort basis - failed deletes are logged, the items will expire.
+
+        :param list locks: DynamoDBLock instances to delete - in batches of up to 25 per BatchExecuteStatement call
+        """
+        for start in range(0, len(locks), self._BATCH_SIZE):
+            batch = locks[start : start + self._BATCH_SIZE]
+            try:
+                codes = self._delete_locks_from_dynamodb(batch)
+            except DynamoDBLockError as ex:
+                self.logger.warning("error occurred when deleting the locks from table", exc_info=str(ex))
+                continue
+            for lock, code in zip(batch, codes):
+                if code is not None:
+                    self.logger.warning(
+                        "error occurred when deleting the lock from table",
+                        lock_unique_identifier=lock.unique_identifier,
+                        code=code,
+                    )
+
+    def _delete_locks_from_dynamodb(self, locks: List[DynamoDBLock]) -> List[Optional[str]]:
+        """
+        Deletes a batch of locks with one BatchExecuteStatement call - each only if its version has not changed.
+
+        :return: The error code of every statement - None for a deleted lock
+        """
+        statement = 'DELETE FROM "%s" WHERE "%s" = ? AND "%s" = ? AND "%s" = ?' % (
+            self._table_name,
+            self._partition_key_name,
+            self._sort_key_name,
+            self._COL_RECORD_VERSION_NUMBER,
+        )
+        serialize = self._serializer.serialize
+        statements = [
+            {
+                "Statement": statement,
+                "Parameters": [
+                    serialize(lock.partition_key),
+                    serialize(lock.sort_key),
+                    serialize(lock.record_version_number),
+                ],
+            }
+            for lock in locks
+        ]
+        try:
+            result = self._dynamodb_table.meta.client.batch_execute_statement(Statements=statements)
+        except ClientError as ex:
+            raise DynamoDBLockError(DynamoDBLockError.UNKNOWN, str(ex)) from ex
+        return [response.get("Error", {}).get("Code") for response in result["Responses"]]
+
     def close(self, release_locks=False):
         """
         Shuts down the background thread - and releases all locks if so asked.
 
+        The scheduler thread is signalled to stop, but not waited for beyond _SCHEDULER_JOIN_TIMEOUT - a
+        thread still busy with a DynamoDB call exits when it is done, or dies with the process.
+
         By default, this method will NOT release all the locks - as releasing the locks while
         the application is still making changes assuming that it has the lock can be dangerous.
         As soon as a lock is released by this client, some other client may pick it up, and the
@@ -761,8 +1271,12 @@ class DynamoDBLockClient:
             return
         self.logger.info("shutting down")
         self._shutting_down = True
-        self._heartbeat_sender_thread.join()
-        self._heartbeat_checker_thread.join()
+        self._shutdown_event.set()
+        self._timer.set()
+        self._scheduler_thread.join(timeout=self._SCHEDULER_JOIN_TIMEOUT)
+        if self._scheduler_thread.is_alive():
+            self.logger.warning("the scheduler thread is still busy - not waiting for it")
+        self._heartbeat_executor.shutdown(wait=False)
         if release_locks:
             self._release_all_locks()
         self._shutting_down = False  # getting ready for next lock
@@ -773,6 +1287,30 @@ class DynamoDBLockClient:
         """
         return "%s::%s" % (self.__class__.__name__, self.__dict__)
 
+    @classmethod
+    def get_boto_config(cls, expected_locks: int = 0) -> Config:
+        """
+        Returns a botocore Config suited for the lock client - pass it when creating the dynamodb_resource.
+
+        The connection pool is sized so parallel heartbeats do not queue on (and re-handshake) the default
+        10-connection pool, TCP keep-alive is enabled where botocore supports it, retries are adaptive and the
+        endpoint-discovery round-trip is skipped. urllib3 already sets TCP_NODELAY on its sockets.
+
+            >>> dynamodb_resource = boto3.resource("dynamodb", config=DynamoDBLockClient.get_boto_config(100))
+
+        :param int expected_locks: The number of locks expected to be held at the same time
+        :rtype: botocore.config.Config
+        """
+        options = {
+            "max_pool_connections": max(cls._MIN_POOL_CONNECTIONS, expected_locks),
+            "retries": {"mode": "adaptive", "max_attempts": cls._MAX_RETRY_ATTEMPTS},
+            "endpoint_discovery_enabled": False,
+        }
+        # older botocore releases (still allowed by our boto3 range) do not know tcp_keepalive
+        if "tcp_keepalive" in Config.OPTION_DEFAULTS:
+            options["tcp_keepalive"] = True
+        return Config(**options)
+
     @classmethod
     def create_dynamodb_table(
         cls,
@@ -9,14 +9,37 @@ This is a general purpose distributed locking library built on top of DynamoDB.
 and fine-grained locking.
 """
 
-import threading
 import time
+from collections import namedtuple
+from functools import lru_cache
 from urllib.parse import quote
 
 from aws_lambda_powertools.logging.logger import Logger
 
 LOGGER = Logger(__name__)
 
+# the same keys are quoted again on every acquire - quote() is a pure-Python loop over the characters
+_quote = lru_cache(maxsize=8192)(quote)
+
+# Read-only view of a lock row as loaded from DynamoDB - lighter than a BaseDynamoDBLock
+DynamoDBLockRecord = namedtuple(
+    "DynamoDBLockRecord",
+    [
+        "partition_key",
+        "sort_key",
+        "owner_name",
+        "lease_duration",
+        "record_version_number",
+        "expiry_time",
+        "additional_attributes",
+    ],
+)
+
+# The read-mostly state of a local lock - replaced as a whole, so a reader never sees a half-updated state
+DynamoDBLockState = namedtuple(
+    "DynamoDBLockState", ["status", "last_updated_time", "record_version_number", "expiry_time"]
+)
+
 
 class BaseDynamoDBLock:
     """
@@ -25,6 +48,19 @@ class BaseDynamoDBLock:
     Typically used within the code to represent a lock held by some other lock-client.
     """
 
+    # one instance per lock - slots keep the instances small and the attribute reads cheap
+    __slots__ = (
+        "partition_key",
+        "sort_key",
+        "owner_name",
+        "lease_duration",
+        "record_version_number",
+        "expiry_time",
+        "additional_attributes",
+        "unique_identifier",
+        "logger",
+    )
+
     def __init__(
         self,
         partition_key,
@@ -54,14 +90,17 @@ class BaseDynamoDBLock:
         self.expiry_time = expiry_time
         self.additional_attributes = additional_attributes or {}
         # additional properties
-        self.unique_identifier = quote(partition_key) + "|" + quote(sort_key)
+        self.unique_identifier = f"{_quote(partition_key)}|{_quote(sort_key)}"
         self.logger = logger if logger else LOGGER
 
     def __str__(self):
         """
         Returns a readable string representation of this instance.
         """
-        return f"{self.__class__.__name__}::{self.__dict__}"
+        attributes = {
+            name: getattr(self, name) for cls in reversed(type(self).__mro__) for name in getattr(cls, "__slots__", ())
+        }
+        return f"{self.__class__.__name__}::{attributes}"
 
 
 class DynamoDBLock(BaseDynamoDBLock):
@@ -69,6 +108,9 @@ class DynamoDBLock(BaseDynamoDBLock):
     Represents a lock that is owned by a local DynamoDBLockClient instance.
     """
 
+    # status, last_updated_time, record_version_number and expiry_time are properties over _state
+    __slots__ = ("_state", "app_callback", "lock_client")
+
     PENDING = "PENDING"
     LOCKED = "LOCKED"
     RELEASED = "RELEASED"
@@ -102,6 +144,7 @@ class DynamoDBLock(BaseDynamoDBLock):
         :param DynamoDBLockClient lock_client: The client that "owns" this lock
         :param Logger logger: you can pass logger in order to write logs
         """
+        self._state = DynamoDBLockState(self.PENDING, time.monotonic(), record_version_number, expiry_time)
         BaseDynamoDBLock.__init__(
             self,
             partition_key,
@@ -116,10 +159,59 @@ class DynamoDBLock(BaseDynamoDBLock):
 
         self.app_callback = app_callback
         self.lock_client = lock_client
-        # additional properties
-        self.last_updated_time = time.monotonic()
-        self.thread_lock = threading.RLock()
-        self.status = self.PENDING
+
+    def _shard(self):
+        """
+        The client's shard lock for this lock - serializes the state changes, the state is read without it
+        """
+        return self.lock_client._shards[self.lock_client._get_shard_index(self.unique_identifier)]
+
+    @property
+    def state(self) -> DynamoDBLockState:
+        """
+        The current state - a single attribute read, safe without holding the shard lock
+        """
+        return self._state
+
+    def update_state(self, **changes) -> None:
+        """
+        Replaces the state with a copy carrying the given changes - a single attribute write
+
+        :param changes: New values for any of the DynamoDBLockState fields
+        """
+        self._state = self._state._replace(**changes)
+
+    @property
+    def status(self):
+        return self._state.status
+
+    @status.setter
+    def status(self, value):
+        self.update_state(status=value)
+
+    @property
+    def last_updated_time(self):
+        return self._state.last_updated_time
+
+    @last_updated_time.setter
+    def last_updated_time(self, value):
+        self.update_state(last_updated_time=value)
+
+    @property
+    def record_version_number(self):
+        return self._state.record_version_number
+
+    @record_version_number.setter
+    def record_version_number(self, value):
+        self.update_state(record_version_number=value)
+
+    @property
+    def expiry_time(self):
+        return self._state.expiry_time
+
+    @expiry_time.setter
+    def expiry_time(self, value):
+        self.update_state(expiry_time=value)
 
     def __enter__(self):
         """
@@ -143,5 +235,9 @@ class DynamoDBLock(BaseDynamoDBLock):
                 and the clean up steps will continue, hence the lock item in DynamoDb might not
                 be updated / deleted but will eventually expire. Defaults to True.
         """
+        if self._state.status in (self.RELEASED, self.INVALID):
+            # released already, or stolen - release_lock would skip it anyway, without the shard lock
+            self.logger.debug("lock already released locally", unique_identifier=self.unique_identifier)
+            return
         self.logger.debug("releasing lock", unique_identifier=self.unique_identifier)
         self.lock_client.release_lock(self, best_effort)
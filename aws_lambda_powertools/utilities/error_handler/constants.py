@@ -2,6 +2,10 @@ from enum import Enum
 
 
 class ErrorDestinationEnum(str, Enum):
+    def __init__(self, *args):
+        # position of the member - lets ErrorHandlerFactory index a list instead of hashing the enum
+        self.ordinal = len(self.__class__.__members__)
+
     SQS = "SQS"
     HTTP_RESPONSE = "HTTP_RESPONSE"
     RAISE_EXCEPTION = "RAISE_EXCEPTION"
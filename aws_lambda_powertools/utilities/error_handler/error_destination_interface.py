@@ -1,20 +1,66 @@
 # pylint: disable=no-name-in-module,unused-argument
+import json
+import traceback
 from abc import ABCMeta, abstractmethod
 from logging import Logger
-from typing import Any, Dict
+from types import TracebackType
+from typing import Any, Dict, Optional, Tuple, Type, Union
 
 from aws_lambda_powertools.utilities.typing import LambdaContext
 
 
+class LazyTraceback:
+    """formats the traceback of an exception on the first str() - not at all, if it is never serialized"""
+
+    __slots__ = ("_exc_info", "_formatted")
+
+    def __init__(
+        self, exc_info: Tuple[Optional[Type[BaseException]], Optional[BaseException], Optional[TracebackType]]
+    ):
+        self._exc_info = exc_info
+        self._formatted: Optional[str] = None
+
+    def __str__(self) -> str:
+        if self._formatted is None:
+            self._formatted = "".join(traceback.format_exception(*self._exc_info))
+            self._exc_info = (None, None, None)  # drop the frames once formatted
+        return self._formatted
+
+
 class ErrorDestinationInterface(metaclass=ABCMeta):
-    def __init__(self, lambda_context: LambdaContext, exception: Exception, trace: str, logger: Logger):
+    # the error message as JSON - every field is filled in already serialized. The layout is the one of
+    # json.dumps(self._build_error_dict()), which the consumers of the messages may rely on
+    _ERROR_TEMPLATE = '{{"error": {0}, "lambda_name": {1}, "request_id": {2}, "traceback": {3}}}'
+
+    __slots__ = ("_lambda_name", "_request_id", "_logger", "_exception", "_lazy_trace")
+
+    def __init__(
+        self, lambda_context: LambdaContext, exception: Exception, trace: Union[str, LazyTraceback], logger: Logger
+    ):
         self._lambda_name = lambda_context.function_name
         self._request_id = lambda_context.aws_request_id
         self._logger = logger
         self._exception = exception
         self._trace = trace
 
-    def _build_error_message(self) -> Dict[str, str]:
+    @property
+    def _trace(self) -> str:
+        """the traceback as a str - a LazyTraceback is formatted on the first access only"""
+        return str(self._lazy_trace)
+
+    @_trace.setter
+    def _trace(self, trace: Union[str, LazyTraceback]) -> None:
+        self._lazy_trace = trace
+
+    def _build_error_json(self) -> str:
+        """returns the error message already serialized to JSON - ready to be sent as is"""
+        dumps = json.dumps
+        return self._ERROR_TEMPLATE.format(
+            dumps(repr(self._exception)), dumps(self._lambda_name), dumps(self._request_id), dumps(self._trace)
+        )
+
+    def _build_error_dict(self) -> Dict[str, str]:
+        """returns the error message as a dict - for destinations that need to add to it"""
         return {
             "error": repr(self._exception),
             "lambda_name": self._lambda_name,
@@ -22,6 +68,10 @@ class ErrorDestinationInterface(metaclass=ABCMeta):
             "traceback": self._trace,
         }
 
+    def _build_error_message(self) -> Dict[str, str]:
+        """returns the error message as a dict - kept for custom destinations, use _build_error_json to send it"""
+        return self._build_error_dict()
+
     @abstractmethod
     def send_error_to_destination(self) -> Any:
         """sends an error message to a destination corresponding the class instance"""
@@ -1,12 +1,13 @@
 # pylint: disable=no-name-in-module,unused-argument,no-value-for-parameter,too-many-arguments
-import traceback
+import functools
+import sys
 from typing import Any, Callable, Dict, Optional
 
 from aws_lambda_powertools.logging import Logger
-from aws_lambda_powertools.middleware_factory import lambda_handler_decorator
 from aws_lambda_powertools.utilities.error_handler.constants import ErrorDestinationEnum
+from aws_lambda_powertools.utilities.error_handler.error_destination_interface import LazyTraceback
 from aws_lambda_powertools.utilities.error_handler.exception import ErrorHandlerException
-from aws_lambda_powertools.utilities.error_handler.handler_factory import ErrorHandlerFactory
+from aws_lambda_powertools.utilities.error_handler.handler_factory import default_factory
 from aws_lambda_powertools.utilities.typing import LambdaContext
 
 
@@ -15,53 +16,80 @@ def check_params(
 ) -> None:
     if not isinstance(destination, ErrorDestinationEnum):
         raise ErrorHandlerException("destination is not a ErrorDestinationEnum, unable to initialize error handler")
-    if not isinstance(logger_factory, Callable):  # type: ignore[arg-type]
+    if not callable(logger_factory):
         raise ErrorHandlerException("logger factory is not a Callable, unable to initialize error handler")
-    if custom_handler is not None and destination != ErrorDestinationEnum.CUSTOM:
+    if custom_handler is not None and destination is not ErrorDestinationEnum.CUSTOM:
         raise ErrorHandlerException(
             "custom destination must be used in conjunction only with ErrorDestinationEnum.CUSTOM"
         )
 
 
-@lambda_handler_decorator
 def error_handler(
-    handler: Callable,
-    event: Dict[str, Any],
-    context: LambdaContext,
-    destination: ErrorDestinationEnum,
-    logger_factory: Callable[[], Logger],
+    handler: Optional[Callable] = None,
+    destination: Optional[ErrorDestinationEnum] = None,
+    logger_factory: Optional[Callable[[], Logger]] = None,
     custom_handler: Optional[str] = None,
-) -> Any:
+    per_request_logger: bool = False,
+) -> Callable:
     """This utility is used for catching unhandled exceptions that your handler code has missed
         and allows to gracefully handle them.
         Error Handler utility offers several handlers, each one will handle your failure differently.
         Each handler logs the exception and adds the following metadata: exception message, traceback,
         lambda name and AWS request ID.
 
+        The arguments are checked, and the handler class resolved, once when decorating - an invocation
+        that does not raise only pays for the try block.
+
     Parameters:
         handler (Callable): lambda handler
-        event (Dict[str, Any]): lambda event
-        context (LambdaContext): lambda context
         destination (ErrorDestinationEnum): error handler type
         logger_factory (Callable[[], object]): [description]   needs to get kwargs that are Dict,
                     not just string, have info/error function. can. you can use the platform's infra logging logger
         custom_handler: Optional[str]: only applicable if destination is set to ErrorDestinationEnum.CUSTOM.
                         This is the class name to initialize when handling with the exception.
                         Class is required to extend ErrorDestinationInterface
+        per_request_logger (bool): call logger_factory on every error. By default the first logger it returns
+                        is reused for the next errors.
     Raises:
-        ErrorHandlerException: an exception that can occur during handling of the original uncaught exception
+        ErrorHandlerException: when decorating with invalid arguments, or an exception that can occur during
+                        handling of the original uncaught exception
 
     Returns:
-        Any:
+        Callable: the decorated lambda handler
     """
+    if handler is None:
+        return functools.partial(
+            error_handler,
+            destination=destination,
+            logger_factory=logger_factory,
+            custom_handler=custom_handler,
+            per_request_logger=per_request_logger,
+        )
+
     # sanity checks
-    check_params(destination, logger_factory, custom_handler)
-    if destination == ErrorDestinationEnum.CUSTOM:
-        ErrorHandlerFactory().register_custom_handler(custom_handler)
+    check_params(destination, logger_factory, custom_handler)  # type: ignore[arg-type]
+    if destination is ErrorDestinationEnum.CUSTOM:
+        default_factory.register_custom_handler(custom_handler)
+    handler_class = default_factory.get_handler_class(destination)  # type: ignore[arg-type]
+    cached_logger = None
+
+    @functools.wraps(handler)
+    def wrapper(event: Dict[str, Any], context: LambdaContext) -> Any:
+        nonlocal cached_logger
+        try:
+            return handler(event, context)
+        except Exception as exc:
+            # formatted only if the destination serializes it
+            trace = LazyTraceback(sys.exc_info())
+            logger = cached_logger
+            if logger is None:
+                logger = logger_factory()  # type: ignore[misc]
+                if logger is None:
+                    raise ErrorHandlerException("logger and/or exception are None")
+                if not per_request_logger:
+                    cached_logger = logger
+            return handler_class(
+                logger=logger, exception=exc, lambda_context=context, trace=trace
+            ).send_error_to_destination()
 
-    try:
-        return handler(event, context)
-    except Exception as exc:
-        trace = traceback.format_exc()
-        logger = logger_factory()
-        return ErrorHandlerFactory().get_handler(destination, logger, exc, context, trace).send_error_to_destination()
+    return wrapper
@@ -1,10 +1,12 @@
 # pylint: disable=no-name-in-module,unused-argument,useless-super-delegation
-import json
 from logging import Logger
-from typing import Any
+from typing import Any, Union
 
 from aws_lambda_powertools.utilities.error_handler.constants import DEFAULT_ERROR_MESSAGE
-from aws_lambda_powertools.utilities.error_handler.error_destination_interface import ErrorDestinationInterface
+from aws_lambda_powertools.utilities.error_handler.error_destination_interface import (
+    ErrorDestinationInterface,
+    LazyTraceback,
+)
 from aws_lambda_powertools.utilities.error_handler.exception import ErrorHandlerException
 from aws_lambda_powertools.utilities.typing import LambdaContext
 
@@ -14,17 +16,19 @@ class ExceptionDestination(ErrorDestinationInterface):
     that contains the exception details
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         lambda_context: LambdaContext,
         exception: Exception,
-        trace: str,
+        trace: Union[str, LazyTraceback],
         logger: Logger,
     ):
         super().__init__(lambda_context, exception, trace, logger)
 
     def send_error_to_destination(self) -> Any:
-        original_error = self._build_error_message()
-        error_str = f"{DEFAULT_ERROR_MESSAGE}. original_error={json.dumps(original_error)}"
+        original_error = self._build_error_json()
+        error_str = f"{DEFAULT_ERROR_MESSAGE}. original_error={original_error}"
         self._logger.error(error_str)
         raise ErrorHandlerException(error_str)
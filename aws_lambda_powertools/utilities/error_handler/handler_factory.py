@@ -1,13 +1,28 @@
-from typing import Dict
+import importlib
+import threading
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from aws_lambda_powertools.utilities.error_handler.constants import ErrorDestinationEnum
-from aws_lambda_powertools.utilities.error_handler.error_destination_interface import ErrorDestinationInterface
+from aws_lambda_powertools.utilities.error_handler.error_destination_interface import (
+    ErrorDestinationInterface,
+    LazyTraceback,
+)
 from aws_lambda_powertools.utilities.error_handler.exception import ErrorHandlerException
-from aws_lambda_powertools.utilities.error_handler.exception_destination import ExceptionDestination
-from aws_lambda_powertools.utilities.error_handler.http_response import HttpResponse
-from aws_lambda_powertools.utilities.error_handler.sqs_destination import SqsDestination
 from aws_lambda_powertools.utilities.typing import LambdaContext
 
+_singleton_lock = threading.Lock()
+
+# the built-in destinations, imported on first use - the SQS destination pulls in boto3
+_BUILT_IN_HANDLERS: Tuple[Tuple[ErrorDestinationEnum, str, str], ...] = (
+    (ErrorDestinationEnum.SQS, "aws_lambda_powertools.utilities.error_handler.sqs_destination", "SqsDestination"),
+    (ErrorDestinationEnum.HTTP_RESPONSE, "aws_lambda_powertools.utilities.error_handler.http_response", "HttpResponse"),
+    (
+        ErrorDestinationEnum.RAISE_EXCEPTION,
+        "aws_lambda_powertools.utilities.error_handler.exception_destination",
+        "ExceptionDestination",
+    ),
+)
+
 
 class Singleton(type):
     """Singleton enforcer. Can be extracted if additional classes need to be singletons."""
@@ -15,18 +30,20 @@ class Singleton(type):
     _instances: Dict = {}
 
     def __call__(cls, *args, **kwargs):
+        # double-checked - only the first construction takes the lock
         if cls not in cls._instances:
-            cls._instances[cls] = super(Singleton, cls).__call__(*args, **kwargs)
+            with _singleton_lock:
+                if cls not in cls._instances:
+                    cls._instances[cls] = super(Singleton, cls).__call__(*args, **kwargs)
         return cls._instances[cls]
 
 
 class ErrorHandlerFactory(metaclass=Singleton):
-    def __init__(self):
-        self._error_handlers = {}
-        # this can be extracted to error_handler for lazy-registration in the future
-        self._register_handler(ErrorDestinationEnum.SQS, SqsDestination)
-        self._register_handler(ErrorDestinationEnum.HTTP_RESPONSE, HttpResponse)
-        self._register_handler(ErrorDestinationEnum.RAISE_EXCEPTION, ExceptionDestination)
+    def __init__(self) -> None:
+        # indexed by ErrorDestinationEnum.ordinal - a (module, class name) pair until the class is first resolved
+        self._error_handlers: List[Optional[object]] = [None] * len(ErrorDestinationEnum)
+        for handler_type, module_name, class_name in _BUILT_IN_HANDLERS:
+            self._register_handler(handler_type, (module_name, class_name))
 
     def _register_handler(self, handler_type: ErrorDestinationEnum, handler_class: object) -> None:
         """
@@ -37,7 +54,7 @@ class ErrorHandlerFactory(metaclass=Singleton):
             handler_class: class name of the error handler. Will not be initialized.
 
         """
-        self._error_handlers[handler_type] = handler_class
+        self._error_handlers[handler_type.ordinal] = handler_class
 
     def register_custom_handler(self, handler_class: object) -> None:
         """
@@ -49,15 +66,41 @@ class ErrorHandlerFactory(metaclass=Singleton):
         """
         self._register_handler(ErrorDestinationEnum.CUSTOM, handler_class)
 
+    def get_handler_class(self, handler_type: ErrorDestinationEnum) -> Any:
+        """
+        Args:
+            handler_type: the type of handler IMPL, from the _error_handlers map.
+
+        Returns:
+            The handler class - not initialized.
+
+        Raises: ErrorHandlerException in case of an unknown handler type
+
+        """
+        ordinal = getattr(handler_type, "ordinal", None)
+        handler_class = self._error_handlers[ordinal] if ordinal is not None else None
+        if handler_class is None:
+            raise ErrorHandlerException(f"{handler_type} is not a valid error handler type")
+        if isinstance(handler_class, tuple):
+            module_name, class_name = handler_class
+            handler_class = getattr(importlib.import_module(module_name), class_name)
+            self._error_handlers[ordinal] = handler_class  # type: ignore[index]
+        return handler_class
+
     def get_handler(
-        self, handler_type: ErrorDestinationEnum, logger: object, exc: Exception, context: LambdaContext, trace: str
+        self,
+        handler_type: ErrorDestinationEnum,
+        logger: object,
+        exc: Exception,
+        context: LambdaContext,
+        trace: Union[str, LazyTraceback],
     ) -> ErrorDestinationInterface:
         """
         Args:
             context: current Lambda context. Will be passed to the handler IMPL.
             exc: caught exception. Will be passed to the handler IMPL.
             logger: logger factory that will return a logger class instance
-            trace: traceback of the exception
+            trace: traceback of the exception - a LazyTraceback is formatted only if the handler serializes it
             handler_type: the type of handler IMPL, from the _error_handlers map, to instantiate.
 
         Returns:
@@ -66,9 +109,11 @@ class ErrorHandlerFactory(metaclass=Singleton):
         Raises: ErrorHandlerException in case of invalid arguments
 
         """
-        handler_class = self._error_handlers.get(handler_type)
-        if handler_class is None:
-            raise ErrorHandlerException(f"{handler_type} is not a valid error handler type")
+        handler_class = self.get_handler_class(handler_type)
         if logger is None or exc is None:
             raise ErrorHandlerException("logger and/or exception are None")
         return handler_class(logger=logger, exception=exc, lambda_context=context, trace=trace)
+
+
+# the factory is a singleton - the decorator reads this reference instead of going through Singleton.__call__
+default_factory = ErrorHandlerFactory()
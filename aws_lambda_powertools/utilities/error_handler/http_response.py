@@ -7,11 +7,14 @@ from aws_lambda_powertools.utilities.error_handler.constants import DEFAULT_ERRO
 from aws_lambda_powertools.utilities.error_handler.error_destination_interface import ErrorDestinationInterface
 
 DEFAULT_HTTP_ERROR_MESSAGE = "internal server error"
+_HTTP_ERROR_BODY = json.dumps({"error": DEFAULT_HTTP_ERROR_MESSAGE})
 
 
 class HttpResponse(ErrorDestinationInterface):
+    __slots__ = ()
+
     def send_error_to_destination(self) -> Any:
-        original_error: str = json.dumps(self._build_error_message())
+        original_error: str = self._build_error_json()
         self._logger.error(
             f"{DEFAULT_ERROR_MESSAGE}. returning HTTP response, status_code={HTTPStatus.INTERNAL_SERVER_ERROR},"
             f" original_error={original_error}"
@@ -19,9 +22,5 @@ class HttpResponse(ErrorDestinationInterface):
         return {
             "statusCode": HTTPStatus.INTERNAL_SERVER_ERROR,
             "headers": {"Content-Type": "application/json"},
-            "body": json.dumps(
-                {
-                    "error": DEFAULT_HTTP_ERROR_MESSAGE,
-                }
-            ),
+            "body": _HTTP_ERROR_BODY,
         }
@@ -1,21 +1,124 @@
 # pylint: disable=no-name-in-module,unused-argument,line-too-long
-import json
+import functools
 import os
+import queue
+import threading
 from logging import Logger
-from typing import Any
+from typing import Any, Dict, List, Optional, Union
 
 import boto3
 
 from aws_lambda_powertools.utilities.error_handler.constants import DEFAULT_ERROR_MESSAGE
-from aws_lambda_powertools.utilities.error_handler.error_destination_interface import ErrorDestinationInterface
+from aws_lambda_powertools.utilities.error_handler.error_destination_interface import (
+    ErrorDestinationInterface,
+    LazyTraceback,
+)
 from aws_lambda_powertools.utilities.error_handler.exception import ErrorHandlerException
 from aws_lambda_powertools.utilities.typing import LambdaContext
 
 ERROR_HANDLER_DLQ_URL = "ERROR_HANDLER_DLQ_URL"
 
 
+@functools.lru_cache(maxsize=4)
+def _get_sqs_client(region: Optional[str] = None) -> Any:
+    # created on the first error and reused by the next ones - across invocations of a warm container.
+    # only the sender thread calls it, so a client is never built twice for a region
+    if region is None:
+        return boto3.client("sqs")
+    return boto3.client("sqs", region_name=region)
+
+
+class _QueuedError:
+    __slots__ = ("queue_url", "body", "attributes", "error", "done")
+
+    def __init__(self, queue_url: str, body: str, attributes: Dict):
+        self.queue_url = queue_url
+        self.body = body
+        self.attributes = attributes
+        self.error: Optional[Exception] = None
+        self.done = threading.Event()
+
+
+class _ErrorQueue:
+    """Sends the error messages from a single daemon thread.
+
+    The errors queued while a send is in flight go out together - one send_message_batch call per 10
+    messages (the SQS limit), a lone error is sent with send_message. Every caller waits for its own
+    message to be sent, so nothing is left in the queue when the Lambda container is frozen.
+    """
+
+    _MAX_BATCH_SIZE = 10
+
+    def __init__(self) -> None:
+        self._queue: queue.Queue = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def send(self, queue_url: str, body: str, attributes: Dict) -> Optional[Exception]:
+        """queues the message and waits till it is sent - returns the error if sending it failed"""
+        entry = _QueuedError(queue_url, body, attributes)
+        self._start_thread()
+        self._queue.put(entry)
+        entry.done.wait()
+        return entry.error
+
+    def _start_thread(self) -> None:
+        # is_alive() - a forked process inherits the thread object, but not the thread
+        if self._thread is None or not self._thread.is_alive():
+            with self._lock:
+                if self._thread is None or not self._thread.is_alive():
+                    self._thread = threading.Thread(name="ErrorHandler-SQS", daemon=True, target=self._send_loop)
+                    self._thread.start()
+
+    def _send_loop(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self._MAX_BATCH_SIZE:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            by_url: Dict[str, List[_QueuedError]] = {}
+            for entry in batch:
+                by_url.setdefault(entry.queue_url, []).append(entry)
+            for queue_url, entries in by_url.items():
+                self._send(queue_url, entries)
+
+    @staticmethod
+    def _send(queue_url: str, entries: List[_QueuedError]) -> None:
+        try:
+            client = _get_sqs_client(os.environ.get("AWS_REGION"))
+            if len(entries) == 1:
+                client.send_message(
+                    QueueUrl=queue_url, MessageBody=entries[0].body, MessageAttributes=entries[0].attributes
+                )
+            else:
+                response = client.send_message_batch(
+                    QueueUrl=queue_url,
+                    Entries=[
+                        {"Id": str(index), "MessageBody": entry.body, "MessageAttributes": entry.attributes}
+                        for index, entry in enumerate(entries)
+                    ],
+                )
+                for failed in response.get("Failed", []):
+                    entries[int(failed["Id"])].error = ErrorHandlerException(failed.get("Message", failed["Code"]))
+        except Exception as exc:  # generic as possible since can fail on unknown issues - permissions etc.
+            for entry in entries:
+                entry.error = exc
+        finally:
+            for entry in entries:
+                entry.done.set()
+
+
+_ERROR_QUEUE = _ErrorQueue()
+
+
 class SqsDestination(ErrorDestinationInterface):
-    def __init__(self, lambda_context: LambdaContext, exception: Exception, trace: str, logger: Logger):
+    __slots__ = ("sqs_url",)
+
+    def __init__(
+        self, lambda_context: LambdaContext, exception: Exception, trace: Union[str, LazyTraceback], logger: Logger
+    ):
         super().__init__(lambda_context, exception, trace, logger)
 
         # check environment variables
@@ -29,28 +132,26 @@ class SqsDestination(ErrorDestinationInterface):
         logger.debug(f"setting SQS DLQ url to {ERROR_HANDLER_DLQ_URL}")
 
     def send_error_to_destination(self) -> Any:
-        original_error = self._build_error_message()
+        original_error = self._build_error_json()
         self._logger.error(
             f"{DEFAULT_ERROR_MESSAGE}. sending unhandled exception to SQS, destination={self.sqs_url}, "
             f"original_error={original_error}"
         )
-        try:
-            client = boto3.client("sqs")
-            client.send_message(
-                QueueUrl=self.sqs_url,
-                MessageBody=json.dumps(original_error),
-                MessageAttributes={
-                    "request_id": {
-                        "DataType": "String",
-                        "StringValue": self._request_id,
-                    },
-                    "sender": {
-                        "DataType": "String",
-                        "StringValue": "error_handler",
-                    },
+        exc = _ERROR_QUEUE.send(
+            self.sqs_url,
+            original_error,
+            {
+                "request_id": {
+                    "DataType": "String",
+                    "StringValue": self._request_id,
                 },
-            )
-        except Exception as exc:  # generic as possible since can fail on unknown issues - permissions etc.
+                "sender": {
+                    "DataType": "String",
+                    "StringValue": "error_handler",
+                },
+            },
+        )
+        if exc is not None:
             error_str = f"failed to send error event to SQS, boto_exception={str(exc)}, destination={self.sqs_url}"
             self._logger.error(error_str)
             return
@@ -1,9 +1,11 @@
-from typing import Any, Callable, Dict, List, Optional
-
-from flatten_dict import flatten, unflatten  # type: ignore[import]
+import hashlib
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
 
 from .filtering_mode import FilterModes
 
+# an initialized blake2b state - copied for every value, instead of initializing a new one
+_BLAKE2B_STATE = hashlib.blake2b(digest_size=16)
+
 
 class Obfuscator:
     """Creates and setups an obfuscator to mask chosen keys in objects.
@@ -33,6 +35,12 @@ class Obfuscator:
     {'id': 111, 'name': '3b2d3431cdc2dc59422eaba64c88393c', 'email': 'adbdfce40472f27324522a8e1bf40b24',
      'location': {'country': 'israel', 'city': 'Tel Aviv'}}
 
+    Example 3:
+    obfuscater = Obfuscator(FilterModes.BlackList, Obfuscator.blake2b)
+    obfuscated_object = obfuscater.obfuscate(INPUT_DICT, ['name', 'email'])
+    print(obfuscated_object)
+    {'id': 111, 'name': '7646b572e39f134b2812e373823d6eb0', 'email': '4ea4c648de87d1a0f10a3683b3b61d51',
+     'location': {'country': 'israel', 'city': 'Tel Aviv'}}
 
     """
 
@@ -46,37 +54,69 @@ class Obfuscator:
     def mask(input_string: str) -> str:
         return "*" * len(input_string)
 
-    def _flatten_json(self, input_obj: Dict) -> Dict[str, Any]:
-        return flatten(input_obj, enumerate_types=(list,))
-
-    def _unflatten(self, dictionary: Dict):
-        return unflatten(dictionary)
+    @staticmethod
+    def blake2b(input_string: str) -> str:
+        """hashes the value to 32 hex characters - as long as an md5 hexdigest, computed faster"""
+        state = _BLAKE2B_STATE.copy()
+        # encode() without arguments is UTF-8, without looking up the codec by name
+        state.update(input_string.encode())
+        return state.hexdigest()
+
+    def _flatten_json(self, input_obj: Dict) -> Dict[Tuple, Any]:
+        """
+        Maps the path of every leaf - a tuple of dict keys and list indexes - to its value.
+        Walks with an explicit stack, so the depth of input_obj is not bound by the recursion limit
+        """
+        flattened: Dict[Tuple, Any] = {}
+        stack: List[Tuple[Tuple, Any]] = [((), input_obj)]
+        while stack:
+            path, value = stack.pop()
+            if isinstance(value, dict):
+                items: Iterable = value.items()
+            elif isinstance(value, list):
+                items = enumerate(value)
+            else:
+                flattened[path] = value
+                continue
+            # pushed in reverse - popped, and so flattened, in the input order
+            stack.extend(reversed([(path + (key,), item) for key, item in items]))
+        return flattened
 
     def _get_keys_to_obfuscate(self, flattened_obj: Dict, keys_to_filter: List) -> List:
-        matched_keys = []
-        flattened_keys = list(flattened_obj.keys())
-        for filter_key in keys_to_filter:
-            for object_key in flattened_keys:
-                if filter_key in object_key:
-                    matched_keys.append(object_key)
-
+        filter_keys = set(keys_to_filter)
         if self.filtering_mode == FilterModes.BlackList:
-            return matched_keys
-        return (
-            matched_keys
-            if self.filtering_mode == FilterModes.BlackList
-            else [key for key in flattened_keys if key not in matched_keys]
-        )
-
-    def _apply_obfuscation(self, flattened_obj: Dict, keys_to_obfuscate: List) -> None:
-        for key in keys_to_obfuscate:
-            obfuscated_value = self.obfuscation_method(flattened_obj[key])
-            flattened_obj[key] = obfuscated_value
+            return [key for key in flattened_obj if not filter_keys.isdisjoint(key)]
+        return [key for key in flattened_obj if filter_keys.isdisjoint(key)]
+
+    def _obfuscate_value(self, obj: Any, filter_keys: Set) -> Any:
+        """
+        Copies obj in a single depth first pass, obfuscating the leaves selected by the filtering mode.
+        Walks with an explicit stack - every entry is a container of the copy, a key in it, the value to copy
+        there, and whether a key on the path to the value is one of filter_keys
+        """
+        # black list obfuscates the matched leaves, white list the rest
+        obfuscate_matched = self.filtering_mode == FilterModes.BlackList
+        root: List[Any] = [None]
+        stack: List[Tuple[Any, Any, Any, bool]] = [(root, 0, obj, False)]
+        while stack:
+            container, key, value, matched = stack.pop()
+            if isinstance(value, dict):
+                # the keys are set right away - the copy keeps the order of value
+                copy: Any = dict.fromkeys(value)
+                stack.extend(
+                    (copy, item_key, item, matched or item_key in filter_keys) for item_key, item in value.items()
+                )
+            elif isinstance(value, list):
+                copy = [None] * len(value)
+                stack.extend((copy, index, item, matched or index in filter_keys) for index, item in enumerate(value))
+            elif matched == obfuscate_matched:
+                copy = self.obfuscation_method(value)
+            else:
+                copy = value
+            container[key] = copy
+        return root[0]
 
     def obfuscate(self, obj: Dict, keys_to_filter: List) -> Dict:
         if not keys_to_filter:
             return obj
-        flattened_obj = self._flatten_json(obj)
-        keys_to_obfuscate = self._get_keys_to_obfuscate(flattened_obj, keys_to_filter)
-        self._apply_obfuscation(flattened_obj, keys_to_obfuscate)
-        return self._unflatten(flattened_obj)
+        return self._obfuscate_value(obj, set(keys_to_filter))
@@ -25,7 +25,9 @@ class BaseProvider(ABC):
     Abstract Base Class for Parameter providers
     """
 
-    store: Any = None
+    __slots__ = ("store",)
+
+    store: Any
 
     def __init__(self):
         """
@@ -34,9 +36,15 @@ class BaseProvider(ABC):
 
         self.store = {}
 
-    def _has_not_expired(self, key: Tuple[str, Optional[str]]) -> bool:
+    def _has_not_expired(self, key: Tuple) -> bool:
         return key in self.store and self.store[key].ttl >= datetime.now()
 
+    def _get_cache_key(self, name: str, transform: Optional[str], sdk_options: Dict[str, Any]) -> Tuple:
+        """
+        Key of a get() value in the store - providers whose sdk_options select a different value extend it
+        """
+        return (name, transform)
+
     def get(
         self,
         name: str,
@@ -81,12 +89,23 @@ class BaseProvider(ABC):
         # of supported transform is small and the probability that a given
         # parameter will always be used in a specific transform, this should be
         # an acceptable tradeoff.
-        value: Optional[Union[str, bytes, dict]] = None
-        key = (name, transform)
+        key = self._get_cache_key(name, transform, sdk_options)
 
         if not force_fetch and self._has_not_expired(key):
             return self.store[key].value
 
+        value = self._get_transformed(name, transform, sdk_options)
+        self.store[key] = ExpirableValue(value, datetime.now() + timedelta(seconds=max_age))
+
+        return value
+
+    def _get_transformed(
+        self, name: str, transform: Optional[str], sdk_options: Dict[str, Any]
+    ) -> Optional[Union[str, dict, bytes]]:
+        """
+        Retrieve a get() value and apply its transform - providers that can skip the transform extend it
+        """
+        value: Optional[Union[str, bytes, dict]] = None
         try:
             value = self._get(name, **sdk_options)
         # Encapsulate all errors into a generic GetParameterError
@@ -98,8 +117,6 @@ class BaseProvider(ABC):
                 value = value.decode("utf-8")
             value = transform_value(value, transform)
 
-        self.store[key] = ExpirableValue(value, datetime.now() + timedelta(seconds=max_age))
-
         return value
 
     @abstractmethod
@@ -2,17 +2,48 @@
 AWS Service Discovery configuration retrieval and caching utility
 """
 
-
-import json
-from typing import Any, Dict, Optional, Union
-from uuid import uuid4
+import os
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import boto3
 from botocore.config import Config
 
-from .base import DEFAULT_MAX_AGE_SECS, DEFAULT_PROVIDERS, BaseProvider
+from ...shared import constants
+from ...shared.json_encoder import dumps
+from .base import DEFAULT_MAX_AGE_SECS, DEFAULT_PROVIDERS, TRANSFORM_METHOD_JSON, BaseProvider
+from .exceptions import GetParameterError
+
+# DiscoverInstances has no pagination - it returns 100 instances unless asked for more, 1000 at most
+DISCOVER_INSTANCES_MAX_RESULTS = 1000
+
+# botocore keeps 10 connections by default - concurrent lookups above it wait for a free connection.
+# An upper bound, overridden by the environment variable or by max_pool_connections in the given config
+DEFAULT_MAX_POOL_CONNECTIONS = 50
+
+
+class _ClientConfig:
+    """
+    Botocore Config compared by its options, so equal configs share one cached client
+    """
+
+    __slots__ = ("config", "_options")
+
+    def __init__(self, config: Config):
+        self.config = config
+        self._options = repr([(option, getattr(config, option)) for option in sorted(Config.OPTION_DEFAULTS)])
+
+    def __hash__(self) -> int:
+        return hash(self._options)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _ClientConfig) and self._options == other._options
+
 
-CLIENT_ID = str(uuid4())
+@lru_cache(maxsize=8)
+def _build_client(client_config: _ClientConfig) -> Any:
+    # created once per container and config, reused by new providers and after clear_caches()
+    return boto3.session.Session().client("servicediscovery", config=client_config.config)
 
 
 class ServiceDiscoveryProvider(BaseProvider):
@@ -23,7 +54,8 @@ class ServiceDiscoveryProvider(BaseProvider):
     ----------
 
     config: botocore.config.Config, optional
-        Botocore configuration to pass during client initialization
+        Botocore configuration to pass during client initialization. max_pool_connections defaults to 50,
+        or to the POWERTOOLS_SERVICE_DISCOVERY_MAX_POOL_CONNECTIONS environment variable
     boto3_session : boto3.session.Session, optional
             Boto3 session to use for AWS API communication
 
@@ -88,7 +120,9 @@ class ServiceDiscoveryProvider(BaseProvider):
         }]
     """
 
-    client: Any = None
+    __slots__ = ("client",)
+
+    client: Any
 
     def __init__(
         self,
@@ -99,12 +133,42 @@ class ServiceDiscoveryProvider(BaseProvider):
         Initialize the App Config client
         """
 
-        config = config or Config()
-        session = boto3_session or boto3.session.Session()
-        self.client = session.client("servicediscovery", config=config)
+        max_pool_connections = int(
+            os.getenv(constants.SERVICE_DISCOVERY_MAX_POOL_CONNECTIONS_ENV, DEFAULT_MAX_POOL_CONNECTIONS)
+        )
+        # values set in the given config win over the pool default
+        config = Config(max_pool_connections=max_pool_connections).merge(config or Config())
+        if boto3_session is None:
+            self.client = _build_client(_ClientConfig(config))
+        else:
+            self.client = boto3_session.client("servicediscovery", config=config)
 
         super().__init__()
 
+    def _get_cache_key(self, name: str, transform: Optional[str], sdk_options: Dict[str, Any]) -> Tuple:
+        # every instance and attribute is cached on its own - a missing attribute as None, till max_age
+        return (name, transform, sdk_options.get("InstanceId"), sdk_options.get("Attribute"))
+
+    def flush_cache_keys(self, keys_to_flush: List[str], transform: Optional[str] = None) -> None:
+        names = set(keys_to_flush)
+        for key in [key for key in self.store if key[0] in names and key[1] == transform]:
+            del self.store[key]
+
+    def _get_transformed(
+        self, name: str, transform: Optional[str], sdk_options: Dict[str, Any]
+    ) -> Optional[Union[str, dict, bytes]]:
+        if transform != TRANSFORM_METHOD_JSON or sdk_options.get("Attribute"):
+            return super()._get_transformed(name, transform, sdk_options)
+
+        # all the attributes as json - return them as they are, instead of serializing and parsing them again
+        try:
+            return self._get_attributes(name, sdk_options)
+        except Exception as exc:
+            raise GetParameterError(str(exc))
+
+    def _get_attributes(self, name: str, sdk_options: Dict[str, Any]) -> Any:
+        return self.client.get_instance(ServiceId=name, InstanceId=sdk_options["InstanceId"])["Instance"]["Attributes"]
+
     def _get(self, name: str, **sdk_options) -> str:
         """
         Retrieve a parameter value from AWS Service Discover
@@ -119,22 +183,24 @@ class ServiceDiscoveryProvider(BaseProvider):
                 InstanceID: of the relevant instance
                 Attribute: the attribute value to bring
 
+        Without an Attribute, all the attributes are returned as a JSON string with sorted keys - the order of
+        the attributes in the Service Discovery response is not kept.
+
         """
 
-        # Explicit arguments will take precedence over keyword arguments
-
-        sdk_options["ServiceId"] = name
-        response = self.client.get_instance(ServiceId=sdk_options["ServiceId"], InstanceId=sdk_options["InstanceId"])[
-            "Instance"
-        ]["Attributes"]
-        if sdk_options.get("Attribute"):
-            return response.get(sdk_options.get("Attribute"))
-        else:
-            return json.dumps(response)
+        attributes = self._get_attributes(name, sdk_options)
+        attribute = sdk_options.get("Attribute")
+        if attribute:
+            # a single attribute is returned as is - the attributes are serialized only when all are asked for
+            return attributes.get(attribute)
+        return dumps(attributes, sort_keys=True)
 
     def _get_multiple(self, path: str, **sdk_options) -> Dict[str, str]:
         """
-        Retrieve a parameter value from AWS Systems Manager Parameter Store
+        Retrieve the instances of a service from AWS Service Discovery
+
+        The instances list of the parsed response is returned as is, without copying it. It is kept in the
+        provider cache and read again by later calls, so it is not turned into a one-pass iterator.
 
         Parameters
         ----------
@@ -144,10 +210,11 @@ class ServiceDiscoveryProvider(BaseProvider):
              Dictionary of options that will be passed to the Service Discovery discover_instances API call.
              Must contain:
                 ServiceName: The name of the service that you specified when you registered the instance.
+             MaxResults defaults to the API maximum of 1000 instances, instead of its default of 100.
 
         """
-        sdk_options["NamespaceName"] = path
-        return self.client.discover_instances(**sdk_options)["Instances"]
+        sdk_options.setdefault("MaxResults", DISCOVER_INSTANCES_MAX_RESULTS)
+        return self.client.discover_instances(NamespaceName=path, **sdk_options)["Instances"]
 
 
 def get_service_attribute(
@@ -1844,7 +1844,13 @@ def test_service_discovery_get_all_attributes(mock_name, mock_value, mock_versio
     # Stub the boto3 client
     stubber = stub.Stubber(provider.client)
     instance_id = "random-id"
-    response = {"Instance": {"Id": instance_id, "CreatorRequestId": "creator-id", "Attributes": {"key": mock_value}}}
+    response = {
+        "Instance": {
+            "Id": instance_id,
+            "CreatorRequestId": "creator-id",
+            "Attributes": {"key": mock_value, "another": "value"},
+        }
+    }
     expected_params = {"ServiceId": mock_name, "InstanceId": instance_id}
     stubber.add_response("get_instance", response, expected_params)
     stubber.activate()
@@ -1852,7 +1858,39 @@ def test_service_discovery_get_all_attributes(mock_name, mock_value, mock_versio
     try:
         value = provider.get(mock_name, **{"InstanceId": instance_id})
 
-        assert value == json.dumps(response["Instance"]["Attributes"])
+        assert value == json.dumps(response["Instance"]["Attributes"], separators=(",", ":"), sort_keys=True)
+        stubber.assert_no_pending_responses()
+    finally:
+        stubber.deactivate()
+
+
+def test_service_discovery_get_all_attributes_json(monkeypatch, mock_name, mock_value, config):
+    """
+    Test ServiceDiscoveryProvider.get() returns the attributes with transform="json" without parsing them
+    """
+
+    def fail_transform(*args, **kwargs):
+        raise AssertionError("attributes should not be transformed")
+
+    monkeypatch.setattr(parameters.base, "transform_value", fail_transform)
+
+    # Create a new provider
+    provider = parameters.ServiceDiscoveryProvider(config=config)
+
+    # Stub the boto3 client
+    stubber = stub.Stubber(provider.client)
+    instance_id = "random-id"
+    response = {"Instance": {"Id": instance_id, "CreatorRequestId": "creator-id", "Attributes": {"key": mock_value}}}
+    expected_params = {"ServiceId": mock_name, "InstanceId": instance_id}
+    stubber.add_response("get_instance", response, expected_params)
+    stubber.activate()
+
+    try:
+        value = provider.get(mock_name, transform="json", InstanceId=instance_id)
+        cached = provider.get(mock_name, transform="json", InstanceId=instance_id)
+
+        assert value == {"key": mock_value}
+        assert cached is value
         stubber.assert_no_pending_responses()
     finally:
         stubber.deactivate()
@@ -1883,15 +1921,106 @@ def test_service_discovery_provider_get_multiple(mock_name, mock_value, mock_ver
         ]
     }
 
-    expected_params = {"NamespaceName": mock_name, "ServiceName": service_name}
+    expected_params = {"NamespaceName": mock_name, "ServiceName": service_name, "MaxResults": 1000}
     stubber.add_response("discover_instances", response, expected_params)
     stubber.activate()
 
     try:
         values = provider.get_multiple(mock_name, **{"ServiceName": service_name})
+        cached = provider.get_multiple(mock_name, **{"ServiceName": service_name})
 
         stubber.assert_no_pending_responses()
 
         assert len(values) == len(mock_param_names)
+        assert cached is values
+        assert [instance["Attributes"]["user"] for instance in cached] == mock_param_names
+    finally:
+        stubber.deactivate()
+
+
+def test_service_discovery_client_reused_per_config(monkeypatch):
+    """
+    Test that providers created without a session share one client per equal config
+    """
+
+    created = []
+
+    class TestSession:
+        def client(self, service_name, config=None):
+            created.append(config.region_name)
+            return object()
+
+    parameters.service_discovery._build_client.cache_clear()
+    monkeypatch.setattr(parameters.service_discovery.boto3.session, "Session", TestSession)
+
+    first = parameters.ServiceDiscoveryProvider()
+    parameters.clear_caches()
+    second = parameters.ServiceDiscoveryProvider()
+    regional = parameters.ServiceDiscoveryProvider(config=Config(region_name="eu-west-1"))
+    same_region = parameters.ServiceDiscoveryProvider(config=Config(region_name="eu-west-1"))
+    parameters.ServiceDiscoveryProvider(config=Config(region_name="eu-west-1", max_pool_connections=20))
+    parameters.ServiceDiscoveryProvider(boto3_session=TestSession())
+    parameters.service_discovery._build_client.cache_clear()
+
+    assert first.client is second.client
+    assert regional.client is same_region.client
+    assert first.client is not regional.client
+    assert created == [None, "eu-west-1", "eu-west-1", None]
+
+
+def test_service_discovery_max_pool_connections(monkeypatch):
+    """
+    Test ServiceDiscoveryProvider raises the connection pool size, unless the config or environment sets it
+    """
+
+    provider = parameters.ServiceDiscoveryProvider(config=Config(region_name="us-east-1"))
+    assert provider.client.meta.config.max_pool_connections == parameters.service_discovery.DEFAULT_MAX_POOL_CONNECTIONS
+
+    provider = parameters.ServiceDiscoveryProvider(config=Config(region_name="us-east-1", max_pool_connections=5))
+    assert provider.client.meta.config.max_pool_connections == 5
+
+    monkeypatch.setenv("POWERTOOLS_SERVICE_DISCOVERY_MAX_POOL_CONNECTIONS", "20")
+    provider = parameters.ServiceDiscoveryProvider(config=Config(region_name="us-east-1"))
+    assert provider.client.meta.config.max_pool_connections == 20
+
+
+def test_service_discovery_provider_has_no_instance_dict(config):
+    """
+    Test ServiceDiscoveryProvider keeps its attributes in slots
+    """
+
+    provider = parameters.ServiceDiscoveryProvider(config=config)
+
+    assert not hasattr(provider, "__dict__")
+    assert provider.store == {}
+
+
+def test_service_discovery_get_caches_each_attribute(mock_name, mock_value, config):
+    """
+    Test ServiceDiscoveryProvider.get() caches every attribute - and a missing one - on its own
+    """
+
+    # Create a new provider
+    provider = parameters.ServiceDiscoveryProvider(config=config)
+
+    # Stub the boto3 client
+    stubber = stub.Stubber(provider.client)
+    instance_id = "random-id"
+    response = {"Instance": {"Id": instance_id, "CreatorRequestId": "creator-id", "Attributes": {"key": mock_value}}}
+    expected_params = {"ServiceId": mock_name, "InstanceId": instance_id}
+    stubber.add_response("get_instance", response, expected_params)
+    stubber.add_response("get_instance", response, expected_params)
+    stubber.activate()
+
+    try:
+        assert provider.get(mock_name, InstanceId=instance_id, Attribute="missing") is None
+        assert provider.get(mock_name, InstanceId=instance_id, Attribute="key") == mock_value
+        # both served from the cache
+        assert provider.get(mock_name, InstanceId=instance_id, Attribute="missing") is None
+        assert provider.get(mock_name, InstanceId=instance_id, Attribute="key") == mock_value
+        stubber.assert_no_pending_responses()
+
+        provider.flush_cache_keys([mock_name])
+        assert provider.store == {}
     finally:
         stubber.deactivate()
@@ -0,0 +1,12 @@
+import pytest
+
+from aws_lambda_powertools.utilities.typing import LambdaContext
+
+
+@pytest.fixture(scope="module")
+def lambda_context() -> LambdaContext:
+    # handlers only read the context - one instance is shared by the tests of a module
+    context = LambdaContext()
+    context._aws_request_id = "1"
+    context._function_name = "test_function_name"
+    return context
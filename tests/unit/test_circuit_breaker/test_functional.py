@@ -1,21 +1,40 @@
 from time import sleep
 from unittest.mock import Mock, patch
 
-from pytest import raises
+from pytest import fixture, raises
 
 from aws_lambda_powertools.utilities.circuit_breaker.base.base_circuit_breaker import CircuitBreakerException, State
 from aws_lambda_powertools.utilities.circuit_breaker.circuit_breaker_monitor import CircuitBreakerMonitor
 from aws_lambda_powertools.utilities.circuit_breaker.in_memory_circuit_breaker import InMemoryCircuitBreaker
 
 TABLE_NAME = "AlonsadovskiHelloDemocircuit-ServiceCircuitBreaker01F9D601-1K8M53UDO7S6D"
-NUM = 0
-THRESH3 = 0
-RAISE_EXCEPTION = False
+
+
+class Counters:
+    """State shared by the decorated functions below, reset for every test through the counters fixture"""
+
+    __slots__ = ("remote_calls", "threshold_3_calls", "raise_exception")
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.remote_calls = 0
+        self.threshold_3_calls = 0
+        self.raise_exception = False
+
+
+COUNTERS = Counters()
+
+
+@fixture
+def counters():
+    COUNTERS.reset()
+    return COUNTERS
 
 
 def pseudo_remote_call():
-    global NUM
-    NUM = NUM + 1
+    COUNTERS.remote_calls += 1
     return True
 
 
@@ -44,17 +63,15 @@ def circuit_threshold_1():
 
 @InMemoryCircuitBreaker(failure_threshold=2, recovery_timeout=3, name="threshold_2")
 def circuit_threshold_2_timeout_1():
-    global RAISE_EXCEPTION
-    if RAISE_EXCEPTION:
+    if COUNTERS.raise_exception:
         raise IOError("Connection refused")
     return True
 
 
 @InMemoryCircuitBreaker(failure_threshold=3, recovery_timeout=1, name="threshold_3")
 def circuit_threshold_3_timeout_1():
-    global THRESH3
-    THRESH3 = THRESH3 + 1
-    if THRESH3 == 1:
+    COUNTERS.threshold_3_calls += 1
+    if COUNTERS.threshold_3_calls == 1:
         return True
     raise IOError("Connection refused")
 
@@ -98,7 +115,7 @@ def test_threshold_hit_prevents_consequent_calls(mock_remote):
 
 
 @patch("tests.unit.test_circuit_breaker.test_functional.pseudo_remote_call", return_value=True)
-def test_circuitbreaker_recover_half_open(mock_remote):
+def test_circuitbreaker_recover_half_open(mock_remote, counters):
     # type: (Mock) -> None
     circuitbreaker = CircuitBreakerMonitor.get("threshold_3")
 
@@ -167,9 +184,7 @@ def test_circuitbreaker_recover_half_open(mock_remote):
 
 
 @patch("tests.unit.test_circuit_breaker.test_functional.pseudo_remote_call", return_value=True)
-def test_circuitbreaker_reopens_after_successful_calls(mock_remote):
-    global RAISE_EXCEPTION
-    RAISE_EXCEPTION = False
+def test_circuitbreaker_reopens_after_successful_calls(mock_remote, counters):
     # type: (Mock) -> None
     circuitbreaker = CircuitBreakerMonitor.get("threshold_2")
 
@@ -184,7 +199,7 @@ def test_circuitbreaker_reopens_after_successful_calls(mock_remote):
     assert circuit_threshold_2_timeout_1()
 
     # from now all subsequent calls will fail
-    RAISE_EXCEPTION = True
+    counters.raise_exception = True
 
     # 1. failed call -> original exception
     with raises(IOError):
@@ -210,7 +225,7 @@ def test_circuitbreaker_reopens_after_successful_calls(mock_remote):
     assert circuitbreaker.open_remaining <= 3000
 
     # from now all subsequent calls will succeed
-    RAISE_EXCEPTION = False
+    counters.raise_exception = False
 
     # but recover timeout has not been reached -> still open
     # 5. failed call -> not passed to function -> CircuitBreakerException
@@ -1,8 +1,9 @@
-from unittest.mock import Mock, patch
+from unittest.mock import patch
 
 from pytest import raises
 
 from aws_lambda_powertools.utilities.circuit_breaker.base.base_circuit_breaker import CircuitBreakerException
+from aws_lambda_powertools.utilities.circuit_breaker.circuit_breaker_monitor import CircuitBreakerMonitor
 from aws_lambda_powertools.utilities.circuit_breaker.in_memory_circuit_breaker import InMemoryCircuitBreaker, circuit
 
 
@@ -15,6 +16,23 @@ class BarError(Exception):
     pass
 
 
+class Stub:
+    """Lightweight callable test double, records the arguments of every call"""
+
+    __name__ = "Stub"
+
+    def __init__(self, return_value=None, side_effect=None):
+        self.return_value = return_value
+        self.side_effect = side_effect
+        self.calls = []
+
+    def __call__(self, *args, **kwargs):
+        self.calls.append((args, kwargs))
+        if self.side_effect is not None:
+            raise self.side_effect
+        return self.return_value
+
+
 def test_circuitbreaker__str__():
     cb = InMemoryCircuitBreaker(name="Foobar")
     assert str(cb) == "Foobar"
@@ -32,7 +50,7 @@ def test_circuitbreaker_error__str__():
 def test_circuitbreaker_should_save_last_exception_on_failure_call():
     cb = InMemoryCircuitBreaker(name="Foobar")
 
-    func = Mock(side_effect=IOError)
+    func = Stub(side_effect=IOError)
 
     with raises(IOError):
         cb.call(func)
@@ -51,9 +69,9 @@ def test_circuitbreaker_should_clear_last_exception_on_success_call():
 
 
 def test_circuitbreaker_should_call_fallback_function_if_open():
-    fallback = Mock(return_value=True)
+    fallback = Stub(return_value=True)
 
-    func = Mock(return_value=False, __name__="Mock")  # attribute __name__ required for 2.7 compat with functools.wraps
+    func = Stub(return_value=False)
 
     InMemoryCircuitBreaker.opened = lambda self: True
 
@@ -61,7 +79,7 @@ def test_circuitbreaker_should_call_fallback_function_if_open():
     decorated_func = cb.decorate(func)
 
     decorated_func()
-    fallback.assert_called_once_with()
+    assert fallback.calls == [((), {})]
 
 
 @patch(
@@ -69,15 +87,15 @@ def test_circuitbreaker_should_call_fallback_function_if_open():
     return_value=True,
 )
 def test_circuitbreaker_should_not_call_function_if_open(patch):
-    fallback = Mock(return_value=True)
+    fallback = Stub(return_value=True)
 
-    func = Mock(return_value=False, __name__="Mock")  # attribute __name__ required for 2.7 compat with functools.wraps
+    func = Stub(return_value=False)
 
     cb = InMemoryCircuitBreaker(name="WithFallback", fallback_function=fallback)
     decorated_func = cb.decorate(func)
 
     assert decorated_func() == fallback.return_value
-    assert not func.called
+    assert not func.calls
 
 
 def mocked_function(*args, **kwargs):
@@ -89,7 +107,7 @@ def mocked_function(*args, **kwargs):
     return_value=True,
 )
 def test_circuitbreaker_call_fallback_function_with_parameters(patch):
-    fallback = Mock(return_value=True)
+    fallback = Stub(return_value=True)
 
     cb = circuit(name="with_fallback", fallback_function=fallback)
 
@@ -100,7 +118,7 @@ def test_circuitbreaker_call_fallback_function_with_parameters(patch):
 
     # check args and kwargs are getting correctly to fallback function
 
-    fallback.assert_called_once_with("test2", test="test")
+    assert fallback.calls == [(("test2",), {"test": "test"})]
 
 
 @patch("aws_lambda_powertools.utilities.circuit_breaker.base.base_circuit_breaker.BaseCircuitBreaker.decorate")
@@ -146,11 +164,18 @@ def test_breaker_constructor_expected_exception_is_exception_list():
     assert not breaker.is_expected_failure(Exception)
 
 
+def test_breaker_constructor_expected_exception_is_single_exception():
+    breaker = circuit("foobar", expected_exception=FooError)
+    assert breaker._expected_exception == (FooError,)
+    assert breaker.is_expected_failure(FooError)
+    assert not breaker.is_expected_failure(BarError)
+
+
 def test_retry():
     def retry_method(test: str):
         raise BarError
 
-    fallback = Mock(return_value=True)
+    fallback = Stub(return_value=True)
 
     cb = circuit(name="with_fallback", fallback_function=fallback)
 
@@ -161,7 +186,7 @@ def test_retry():
 
     # check args and kwargs are getting correctly to fallback function
     assert cb._threshold_occurred()
-    fallback.assert_called_once_with(test="test")
+    assert fallback.calls == [((), {"test": "test"})]
 
 
 COUNT = 0
@@ -176,7 +201,7 @@ def test_retry_3_times():
         else:
             raise BarError
 
-    fallback = Mock(return_value=True)
+    fallback = Stub(return_value=True)
 
     cb = circuit(name="with_fallback", fallback_function=fallback)
 
@@ -187,4 +212,43 @@ def test_retry_3_times():
 
     # check args and kwargs are getting correctly to fallback function
     assert not cb._threshold_occurred()
-    assert fallback.call_count == 0
+    assert not fallback.calls
+
+
+def test_circuitbreaker_monitor_tracks_open_circuits():
+    class Monitor(CircuitBreakerMonitor):
+        circuit_breakers = {}
+        open_circuit_breakers = {}
+        remote_circuit_breakers = {}
+
+    cb = InMemoryCircuitBreaker(name="Tracked", failure_threshold=1, monitor=Monitor)
+    cb.decorate(lambda: True)
+    assert Monitor.remote_circuit_breakers == {}
+
+    with raises(IOError):
+        cb.call(Stub(side_effect=IOError))
+    assert Monitor.open_circuit_breakers == {"Tracked": cb}
+
+    cb.call(lambda: True)
+    assert Monitor.open_circuit_breakers == {}
+    assert list(Monitor.get_closed()) == [cb]
+
+
+def test_open_remaining_uses_monotonic_clock():
+    module = "aws_lambda_powertools.utilities.circuit_breaker.in_memory_circuit_breaker.monotonic_ns"
+    with patch(module, return_value=5_000_000_000):
+        cb = InMemoryCircuitBreaker(name="Monotonic", failure_threshold=1, recovery_timeout=2)
+        with raises(IOError):
+            cb.call(Stub(side_effect=IOError))
+
+    with patch(module, return_value=5_500_000_000):
+        assert cb.open_remaining == 1500
+    with patch(module, return_value=7_000_000_001):
+        assert cb.open_remaining < 0
+
+
+def test_in_memory_circuitbreaker_has_no_instance_dict():
+    cb = InMemoryCircuitBreaker(name="Slots")
+    assert not hasattr(cb, "__dict__")
+    with raises(AttributeError):
+        cb.unknown = True
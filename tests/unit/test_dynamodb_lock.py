@@ -1,6 +1,7 @@
 # pylint: disable= print-used, protected-access, invalid-name, deprecated-method, unused-variable
 
 import datetime
+import threading
 import time
 import unittest
 from unittest import mock
@@ -57,19 +58,24 @@ class TestDynamoDBLockClient(unittest.TestCase):
     # send_heartbeat tests
 
     def test_background_threads(self):
-        heartbeat_sender = self.lock_client._heartbeat_sender_thread
-        self.assertIsNotNone(heartbeat_sender)
-        self.assertTrue(heartbeat_sender.isDaemon())
-        self.assertTrue(heartbeat_sender.isAlive())
-        heartbeat_checker = self.lock_client._heartbeat_checker_thread
-        self.assertIsNotNone(heartbeat_checker)
-        self.assertTrue(heartbeat_checker.isDaemon())
-        self.assertTrue(heartbeat_checker.isAlive())
+        scheduler = self.lock_client._scheduler_thread
+        self.assertIsNotNone(scheduler)
+        self.assertTrue(scheduler.daemon)
+        self.assertTrue(scheduler.is_alive())
         # now, close the client
         self.lock_client.close()
-        # and check that the threads are also shutdown
-        self.assertFalse(heartbeat_sender.isAlive())
-        self.assertFalse(heartbeat_checker.isAlive())
+        # and check that the thread is also shutdown
+        self.assertFalse(scheduler.is_alive())
+
+    def test_scheduler_runs_actions_in_deadline_order(self):
+        calls = []
+        now = time.monotonic()
+        self.lock_client._schedule_action(now + 0.1, calls.append, "second")
+        self.lock_client._schedule_action(now + 0.05, calls.append, "first")
+        time.sleep(50 / 1000)
+        self.assertLessEqual(len(calls), 1)
+        time.sleep(150 / 1000)
+        self.assertEqual(calls, ["first", "second"])
 
     def test_send_heartbeat_success(self):
         self.ddb_table.update_item = mock.MagicMock("update_item")
@@ -111,6 +117,95 @@ class TestDynamoDBLockClient(unittest.TestCase):
         self.ddb_table.update_item.side_effect = None
         self.assertEqual(len(self.app_callbacks), 0)  # ignore other Runtime Errors
 
+    def test_send_heartbeat_multiple_locks_after_error(self):
+        batch_execute_statement = self.ddb_table.meta.client.batch_execute_statement
+        batch_execute_statement.side_effect = RuntimeError("TestError")
+        self.lock_client.acquire_lock("key1")
+        self.lock_client.acquire_lock("key2")
+        time.sleep(200 / 1000)
+        self.assertTrue(self.lock_client._scheduler_thread.is_alive())
+        batch_execute_statement.side_effect = lambda Statements: {"Responses": [{} for _ in Statements]}
+        batch_execute_statement.reset_mock()
+        time.sleep(200 / 1000)
+        updated_keys = {
+            statement["Parameters"][2]["S"]
+            for _, kwargs in batch_execute_statement.call_args_list
+            for statement in kwargs["Statements"]
+        }
+        self.assertEqual(updated_keys, {"key1", "key2"})
+        self.ddb_table.update_item.assert_not_called()
+
+    def test_send_heartbeats_lock_stolen(self):
+        self.lock_client._owner_name = "owner"
+        lock1 = self.lock_client.acquire_lock("key1", app_callback=self.app_callback)
+        lock2 = self.lock_client.acquire_lock("key2", app_callback=self.app_callback)
+        old_record_version_number = lock1.record_version_number
+        self.ddb_table.meta.client.batch_execute_statement.return_value = {
+            "Responses": [{}, {"Error": {"Code": "ConditionalCheckFailed"}}]
+        }
+        self.lock_client._send_heartbeats([lock1, lock2])
+        self.assertNotEqual(lock1.record_version_number, old_record_version_number)
+        self.assertEqual(lock2.status, "INVALID")
+        self.assertNotIn(lock2.unique_identifier, self.lock_client._locks)
+        time.sleep(50 / 1000)
+        self.assertEqual(self.app_callbacks, [(DynamoDBLockError.LOCK_STOLEN, lock2)])
+
+    def test_send_heartbeat_releases_shard_during_update(self):
+        self.ddb_table.delete_item = mock.MagicMock("delete_item")
+        lock = self.lock_client.acquire_lock("key")
+        old_record_version_number = lock.record_version_number
+        releaser = threading.Thread(target=lock.release)
+
+        def update_item(**kwargs):
+            # a release on another thread is not blocked by the heartbeat round-trip
+            if releaser.ident is None:
+                releaser.start()
+            releaser.join(timeout=1)
+            self.assertFalse(releaser.is_alive())
+
+        self.ddb_table.update_item = mock.MagicMock("update_item", side_effect=update_item)
+        self.lock_client._send_heartbeat(lock)
+        self.assertEqual(lock.status, "RELEASED")
+        self.assertNotIn(lock.unique_identifier, self.lock_client._renewing)
+        # the release deleted the old version - the renewed one is deleted again
+        _, kwargs = self.ddb_table.delete_item.call_args
+        self.assertEqual(kwargs["ExpressionAttributeValues"][":rvn"], old_record_version_number)
+        _, kwargs = self.ddb_table.meta.client.batch_execute_statement.call_args
+        statement = kwargs["Statements"][0]
+        self.assertTrue(statement["Statement"].startswith('DELETE FROM "DynamoDBLockTable"'))
+        self.assertEqual(statement["Parameters"][2], {"S": lock.record_version_number})
+        self.assertNotEqual(lock.record_version_number, old_record_version_number)
+
+    def test_release_lock_during_heartbeat_not_stolen(self):
+        self.ddb_table.delete_item = mock.MagicMock(
+            "delete_item",
+            side_effect=ClientError({"Error": {"Code": "ConditionalCheckFailedException"}}, "delete_item"),
+        )
+        lock = self.lock_client.acquire_lock("key")
+        self.ddb_table.update_item = mock.MagicMock(
+            "update_item", side_effect=lambda **kwargs: self.lock_client.release_lock(lock, best_effort=False)
+        )
+        self.lock_client._send_heartbeat(lock)
+        self.assertEqual(lock.status, "RELEASED")
+        self.ddb_table.meta.client.batch_execute_statement.assert_called_once()
+
+    def test_release_lock_during_heartbeat_ddb_error(self):
+        self.ddb_table.delete_item = mock.MagicMock(
+            "delete_item", side_effect=ClientError({"Error": {"Code": "AccessDeniedException"}}, "delete_item")
+        )
+        lock = self.lock_client.acquire_lock("key")
+        errors = []
+
+        def update_item(**kwargs):
+            try:
+                self.lock_client.release_lock(lock, best_effort=False)
+            except DynamoDBLockError as ex:
+                errors.append(ex.code)
+
+        self.ddb_table.update_item = mock.MagicMock("update_item", side_effect=update_item)
+        self.lock_client._send_heartbeat(lock)
+        self.assertEqual(errors, [DynamoDBLockError.UNKNOWN])
+
     # this tests the heartbeat_checker_thread and the app_callback_executor
     def test_send_heartbeat_in_danger(self):
         self.ddb_table.update_item = mock.MagicMock("update_item")
@@ -122,6 +217,50 @@ class TestDynamoDBLockClient(unittest.TestCase):
         (code, lock) = self.app_callbacks.pop(0)
         self.assertEqual(code, DynamoDBLockError.LOCK_IN_DANGER)
 
+    def test_check_heartbeat_without_shard_lock(self):
+        lock = self.lock_client.acquire_lock("key")
+        shard = mock.MagicMock(name="shard")
+        self.lock_client._shards = [shard] * self.lock_client._LOCK_SHARDS
+        self.lock_client._check_heartbeat(lock)
+        shard.__enter__.assert_not_called()
+        self.assertEqual(lock.status, "LOCKED")
+
+    def test_check_heartbeat_skips_replaced_state(self):
+        lock = self.lock_client.acquire_lock("key", app_callback=self.app_callback)
+        lock.last_updated_time = time.monotonic() - 10
+        shard = mock.MagicMock(name="shard")
+        self.lock_client._shards = [shard] * self.lock_client._LOCK_SHARDS
+        # a heartbeat lands while the checker waits for the shard lock
+        shard.__enter__.side_effect = lambda: lock.update_state(last_updated_time=time.monotonic())
+        self.lock_client._check_heartbeat(lock)
+        self.assertEqual(lock.status, "LOCKED")
+        self.assertEqual(self.app_callbacks, [])
+
+    def test_lock_uses_slots(self):
+        lock = self.lock_client.acquire_lock("key")
+        self.assertFalse(hasattr(lock, "__dict__"))
+        self.assertIn("'partition_key': 'key'", str(lock))
+        self.assertIn("status='LOCKED'", str(lock))
+
+    # app_callback tests
+
+    def test_call_app_callback_without_callback(self):
+        self.lock_client._app_callback_executor = mock.MagicMock(name="executor")
+        lock = self.lock_client.acquire_lock("key")
+        self.lock_client._call_app_callback(lock, DynamoDBLockError.LOCK_IN_DANGER)
+        self.lock_client._app_callback_executor.submit.assert_not_called()
+
+    def test_call_app_callback_inline(self):
+        self.lock_client._app_callback_executor = mock.MagicMock(name="executor")
+        self.app_callback.__func__._ddblock_inline = True
+        try:
+            lock = self.lock_client.acquire_lock("key", app_callback=self.app_callback)
+            self.lock_client._call_app_callback(lock, DynamoDBLockError.LOCK_IN_DANGER)
+        finally:
+            del self.app_callback.__func__._ddblock_inline
+        self.lock_client._app_callback_executor.submit.assert_not_called()
+        self.assertEqual(self.app_callbacks, [(DynamoDBLockError.LOCK_IN_DANGER, lock)])
+
     # acquire_lock tests
 
     def test_acquire_lock_success(self):
@@ -136,6 +275,215 @@ class TestDynamoDBLockClient(unittest.TestCase):
         self.assertTrue(lock.unique_identifier in locks)
         self.assertEqual(locks[lock.unique_identifier], lock)
 
+    def test_acquire_lock_issues_single_put(self):
+        self.ddb_table.get_item = mock.MagicMock("get_item", return_value={})
+        self.ddb_table.put_item = mock.MagicMock("put_item")
+        self.lock_client.acquire_lock("key")
+        self.ddb_table.put_item.assert_called_once()
+        _, kwargs = self.ddb_table.put_item.call_args
+        self.assertEqual(kwargs["ConditionExpression"], "NOT(attribute_exists(#pk) AND attribute_exists(#sk))")
+
+    def test_acquire_lock_put_first_without_get(self):
+        self.lock_client._put_returns_old_item = True
+        self.ddb_table.get_item = mock.MagicMock("get_item")
+        self.ddb_table.put_item = mock.MagicMock("put_item")
+        self.lock_client.acquire_lock("key")
+        self.ddb_table.get_item.assert_not_called()
+        _, kwargs = self.ddb_table.put_item.call_args
+        self.assertEqual(kwargs["ReturnValuesOnConditionCheckFailure"], "ALL_OLD")
+
+    def test_acquire_lock_put_first_returns_existing_lock(self):
+        self.lock_client._put_returns_old_item = True
+        old_item = {
+            "lock_key": {"S": "key"},
+            "sort_key": {"S": "-"},
+            "owner_name": {"S": "other"},
+            "lease_duration": {"N": "1.0"},
+            "record_version_number": {"S": "r1"},
+            "expiry_time": {"N": "9999999999"},
+        }
+        self.ddb_table.get_item = mock.MagicMock("get_item", return_value={})
+        self.ddb_table.put_item = mock.MagicMock(
+            "put_item",
+            side_effect=[
+                ClientError({"Error": {"Code": "ConditionalCheckFailedException"}, "Item": old_item}, "put_item"),
+                {},
+            ],
+        )
+        self.lock_client.acquire_lock("key")
+        self.ddb_table.get_item.assert_called_once()
+        self.assertEqual(self.ddb_table.put_item.call_count, 2)
+
+    def test_get_lock_from_condition_check_failure(self):
+        ex = ClientError(
+            {
+                "Error": {"Code": "ConditionalCheckFailedException"},
+                "Item": {
+                    "lock_key": {"S": "key"},
+                    "sort_key": {"S": "-"},
+                    "owner_name": {"S": "other"},
+                    "lease_duration": {"N": "1.5"},
+                    "record_version_number": {"S": "r1"},
+                    "expiry_time": {"N": "100"},
+                },
+            },
+            "put_item",
+        )
+        lock = self.lock_client._get_lock_from_condition_check_failure(ex)
+        self.assertEqual(lock.record_version_number, "r1")
+        self.assertEqual(lock.lease_duration, 1.5)
+        self.assertIsNone(
+            self.lock_client._get_lock_from_condition_check_failure(
+                ClientError({"Error": {"Code": "ConditionalCheckFailedException"}}, "put_item")
+            )
+        )
+
+    def test_acquire_lock_wakes_up_on_local_release(self):
+        held_item = {
+            "lock_key": "key",
+            "sort_key": "-",
+            "owner_name": "o1",
+            "lease_duration": 1.0,
+            "record_version_number": "r1",
+            "expiry_time": 9999999999,
+        }
+        self.ddb_table.get_item = mock.MagicMock(
+            "get_item", side_effect=lambda **kwargs: {"Item": held_item} if self.lock_client._locks else {}
+        )
+        self.ddb_table.put_item = mock.MagicMock("put_item")
+        lock = self.lock_client.acquire_lock("key")
+        threading.Timer(0.2, lock.release).start()
+        start = time.monotonic()
+        self.lock_client.acquire_lock(
+            "key", retry_period=datetime.timedelta(seconds=5), retry_timeout=datetime.timedelta(seconds=10)
+        )
+        self.assertLess(time.monotonic() - start, 2)
+
+    def test_acquire_lock_ignores_release_of_other_key(self):
+        self.lock_client._put_returns_old_item = False
+        held_item = {
+            "lock_key": "key",
+            "sort_key": "-",
+            "owner_name": "o1",
+            "lease_duration": 60.0,
+            "record_version_number": "r1",
+            "expiry_time": 9999999999,
+        }
+        self.ddb_table.get_item = mock.MagicMock(
+            "get_item", side_effect=lambda **kwargs: {"Item": held_item} if kwargs["Key"]["lock_key"] == "key" else {}
+        )
+        self.ddb_table.put_item = mock.MagicMock("put_item")
+        other_locks = [self.lock_client.acquire_lock(f"other{i}") for i in range(7)]
+        self.ddb_table.get_item.reset_mock()
+
+        def release_other_locks():
+            for other_lock in other_locks:
+                time.sleep(0.05)
+                other_lock.release()
+
+        threading.Thread(target=release_other_locks).start()
+        start = time.monotonic()
+        with self.assertRaises(DynamoDBLockError) as context:
+            self.lock_client.acquire_lock(
+                "key", retry_period=datetime.timedelta(milliseconds=500), retry_timeout=datetime.timedelta(seconds=1)
+            )
+        self.assertEqual(context.exception.code, DynamoDBLockError.ACQUIRE_TIMEOUT)
+        self.assertGreaterEqual(time.monotonic() - start, 0.9)
+        # an attempt at 0, 500 and 1000 millis - the releases of the other keys do not add any
+        self.assertEqual(self.ddb_table.get_item.call_count, 3)
+        self.assertEqual(self.lock_client._release_waiters, {})
+
+    def test_acquire_locks_skips_taken_locks(self):
+        self.lock_client._owner_name = "owner"
+        batch_execute_statement = self.ddb_table.meta.client.batch_execute_statement
+        batch_execute_statement.side_effect = lambda Statements: {
+            "Responses": [{"Error": {"Code": "DuplicateItem"}} if i == 1 else {} for i in range(len(Statements))]
+        }
+        keys = [(f"key{i}", "-") for i in range(30)]
+        locks = self.lock_client.acquire_locks(keys)
+        self.assertEqual(batch_execute_statement.call_count, 2)
+        self.assertEqual([lock.partition_key for lock in locks], [f"key{i}" for i in range(30) if i not in (1, 26)])
+        self.assertEqual(len(self.lock_client._locks), 28)
+        self.assertTrue(all(lock.status == "LOCKED" for lock in locks))
+        statement = batch_execute_statement.call_args_list[0][1]["Statements"][0]
+        self.assertTrue(statement["Statement"].startswith('INSERT INTO "DynamoDBLockTable" VALUE {'))
+        self.assertIn({"S": "key0"}, statement["Parameters"])
+
+    def test_acquire_locks_retries_throttled_locks(self):
+        self.lock_client._owner_name = "owner"
+        batch_execute_statement = self.ddb_table.meta.client.batch_execute_statement
+        batch_execute_statement.side_effect = [
+            {"Responses": [{}, {"Error": {"Code": "ThrottlingError"}}]},
+            {"Responses": [{}]},
+        ]
+        locks = self.lock_client.acquire_locks([("key1", "-"), ("key2", "-")])
+        self.assertEqual([lock.partition_key for lock in locks], ["key1", "key2"])
+
+    def test_acquire_locks_ddb_error(self):
+        self.lock_client._owner_name = "owner"
+        self.ddb_table.meta.client.batch_execute_statement.return_value = {
+            "Responses": [{"Error": {"Code": "AccessDenied"}}]
+        }
+        with self.assertRaises(DynamoDBLockError):
+            self.lock_client.acquire_locks([("key", "-")])
+
+    def test_acquire_locks_releases_acquired_locks_on_error(self):
+        self.lock_client._owner_name = "owner"
+        batch_execute_statement = self.ddb_table.meta.client.batch_execute_statement
+        batch_execute_statement.side_effect = [
+            {"Responses": [{} for _ in range(25)]},
+            ClientError({"Error": {"Code": "SomeOtherDynamoDBError"}}, "batch_execute_statement"),
+            {"Responses": [{} for _ in range(25)]},
+        ]
+        with self.assertRaises(DynamoDBLockError):
+            self.lock_client.acquire_locks([(f"key{i}", "-") for i in range(30)])
+        self.assertEqual(len(self.lock_client._locks), 0)
+        statements = batch_execute_statement.call_args[1]["Statements"]
+        self.assertEqual(len(statements), 25)
+        self.assertTrue(statements[0]["Statement"].startswith('DELETE FROM "DynamoDBLockTable"'))
+
+    def test_acquire_locks_releases_batch_with_unknown_code(self):
+        self.lock_client._owner_name = "owner"
+        batch_execute_statement = self.ddb_table.meta.client.batch_execute_statement
+        batch_execute_statement.side_effect = [
+            {"Responses": [{}, {"Error": {"Code": "AccessDenied"}}]},
+            {"Responses": [{}]},
+        ]
+        with self.assertRaises(DynamoDBLockError):
+            self.lock_client.acquire_locks([("key1", "-"), ("key2", "-")])
+        self.assertEqual(len(self.lock_client._locks), 0)
+        statement = batch_execute_statement.call_args[1]["Statements"][0]
+        self.assertTrue(statement["Statement"].startswith('DELETE FROM "DynamoDBLockTable"'))
+        self.assertEqual(statement["Parameters"][0], {"S": "key1"})
+
+    def test_get_lock_with_read_cache(self):
+        self.lock_client._read_cache_period = 60.0
+        self.ddb_table.get_item = mock.MagicMock("get_item", return_value={})
+        self.assertIsNone(self.lock_client._get_lock_from_dynamodb("key", "-"))
+        self.assertIsNone(self.lock_client._get_lock_from_dynamodb("key", "-"))
+        self.ddb_table.get_item.assert_called_once()
+
+    def test_acquire_lock_reads_through_dax(self):
+        dax_resource = mock.MagicMock(name="dax_resource")
+        dax_client = DynamoDBLockClient(
+            self.ddb_resource,
+            table_name="DynamoDBLockTable",
+            partition_key_name="lock_key",
+            sort_key_name="sort_key",
+            owner_name=uuid4(),
+            dax_resource=dax_resource,
+        )
+        dax_table = dax_resource.Table.return_value
+        dax_table.get_item.return_value = {}
+        dax_client._dynamodb_table = self.ddb_table
+        try:
+            dax_client.acquire_lock("key")
+        finally:
+            dax_client.close()
+        dax_table.get_item.assert_called_once_with(Key={"lock_key": "key", "sort_key": "-"})
+        self.ddb_table.get_item.assert_not_called()
+        self.ddb_table.put_item.assert_called_once()
+
     def test_acquire_lock_after_release(self):
         self.ddb_table.get_item = mock.MagicMock("get_item")
         self.ddb_table.get_item.side_effect = [
@@ -147,7 +495,7 @@ class TestDynamoDBLockClient(unittest.TestCase):
                     "owner_name": "owner",
                     "lease_duration": 0.3,
                     "record_version_number": "xyz",
-                    "expiry_time": 100,
+                    "expiry_time": 9999999999,
                 }
             },
             # second call, act as if its been deleted
@@ -168,7 +516,7 @@ class TestDynamoDBLockClient(unittest.TestCase):
                 "owner_name": "owner",
                 "lease_duration": 0.3,
                 "record_version_number": "xyz",
-                "expiry_time": 100,
+                "expiry_time": 9999999999,
             }
         }
         start_time = time.monotonic()
@@ -177,6 +525,49 @@ class TestDynamoDBLockClient(unittest.TestCase):
         self.assertIsNotNone(lock)
         self.assertTrue((end_time - start_time) * 1000 >= 300)
 
+    def test_acquire_lock_past_expiry_time(self):
+        self.ddb_table.get_item = mock.MagicMock("get_item")
+        self.ddb_table.get_item.side_effect = lambda **kwargs: {
+            "Item": {
+                "lock_key": "key",
+                "sort_key": "-",
+                "owner_name": "owner",
+                "lease_duration": 0.3,
+                "record_version_number": "xyz",
+                "expiry_time": 100,
+            }
+        }
+        self.ddb_table.put_item = mock.MagicMock("put_item")
+        start_time = time.monotonic()
+        lock = self.lock_client.acquire_lock("key", retry_period=datetime.timedelta(milliseconds=100))
+        self.assertIsNotNone(lock)
+        self.assertLess((time.monotonic() - start_time) * 1000, 100)
+        self.ddb_table.get_item.assert_called_once()
+        _, kwargs = self.ddb_table.put_item.call_args
+        self.assertEqual(kwargs["ExpressionAttributeValues"][":old_rvn"], "xyz")
+
+    def test_acquire_lock_put_first_returns_expired_lock(self):
+        self.lock_client._put_returns_old_item = True
+        old_item = {
+            "lock_key": {"S": "key"},
+            "sort_key": {"S": "-"},
+            "owner_name": {"S": "other"},
+            "lease_duration": {"N": "1.0"},
+            "record_version_number": {"S": "r1"},
+            "expiry_time": {"N": "100"},
+        }
+        self.ddb_table.get_item = mock.MagicMock("get_item")
+        self.ddb_table.put_item = mock.MagicMock(
+            "put_item",
+            side_effect=[
+                ClientError({"Error": {"Code": "ConditionalCheckFailedException"}, "Item": old_item}, "put_item"),
+                {},
+            ],
+        )
+        self.lock_client.acquire_lock("key", retry_period=datetime.timedelta(seconds=5))
+        self.ddb_table.get_item.assert_not_called()
+        self.assertEqual(self.ddb_table.put_item.call_count, 2)
+
     def test_acquire_lock_retry_timeout(self):
         self.ddb_table.get_item = mock.MagicMock("get_item")
         self.ddb_table.get_item.side_effect = lambda **kwargs: {
@@ -186,7 +577,7 @@ class TestDynamoDBLockClient(unittest.TestCase):
                 "owner_name": "owner",
                 "lease_duration": 0.6,
                 "record_version_number": "xyz",
-                "expiry_time": 100,
+                "expiry_time": 9999999999,
             }
         }
         start_time = time.monotonic()
@@ -232,6 +623,30 @@ class TestDynamoDBLockClient(unittest.TestCase):
 
     # release_lock tests
 
+    def test_register_lock_replaces_stale_local_lock(self):
+        stale_lock = self.lock_client.acquire_lock("key", app_callback=self.app_callback)
+        new_lock = self.lock_client._create_new_lock("key", "-", None, None)
+        self.lock_client._register_new_lock_local_memory(new_lock)
+        self.assertIs(self.lock_client._locks[new_lock.unique_identifier], new_lock)
+        self.assertEqual(stale_lock.status, "INVALID")
+        time.sleep(50 / 1000)
+        self.assertEqual(self.app_callbacks, [(DynamoDBLockError.LOCK_STOLEN, stale_lock)])
+        # releasing the stale lock leaves the new one in place
+        stale_lock.release()
+        self.assertIs(self.lock_client._locks[new_lock.unique_identifier], new_lock)
+
+    def test_register_lock_invalidates_stale_lock_under_shard(self):
+        stale_lock = self.lock_client.acquire_lock("key")
+        new_lock = self.lock_client._create_new_lock("key", "-", None, None)
+        shard = mock.MagicMock(name="shard")
+        self.lock_client._shards = [shard] * self.lock_client._LOCK_SHARDS
+        # the status is still LOCKED when the shard is entered, and INVALID when it is left
+        shard.__enter__.side_effect = lambda: self.assertEqual(stale_lock.status, "LOCKED")
+        shard.__exit__.side_effect = lambda *args: self.assertEqual(stale_lock.status, "INVALID")
+        self.lock_client._register_new_lock_local_memory(new_lock)
+        shard.__enter__.assert_called_once()
+        shard.__exit__.assert_called_once()
+
     def test_release_lock_success(self):
         self.ddb_table.delete_item = mock.MagicMock("delete_item")
         lock = self.lock_client.acquire_lock("key")
@@ -265,6 +680,22 @@ class TestDynamoDBLockClient(unittest.TestCase):
             self.assertEqual(e.code, DynamoDBLockError.UNKNOWN)
             self.assertTrue(lock.unique_identifier not in self.lock_client._locks)
 
+    def test_release_released_lock(self):
+        self.ddb_table.delete_item = mock.MagicMock("delete_item")
+        lock = self.lock_client.acquire_lock("key")
+        lock.release()
+        with mock.patch.object(self.lock_client, "release_lock") as release_lock:
+            lock.release()
+        release_lock.assert_not_called()
+        self.ddb_table.delete_item.assert_called_once()
+
+    def test_release_stolen_lock(self):
+        self.ddb_table.delete_item = mock.MagicMock("delete_item")
+        lock = self.lock_client.acquire_lock("key")
+        self.lock_client._invalidate_stolen_lock(lock)
+        lock.release()
+        self.ddb_table.delete_item.assert_not_called()
+
     # release_lock tests - with best_effort=True
 
     def test_best_effort_release_lock_not_owned(self):
@@ -316,6 +747,15 @@ class TestDynamoDBLockClient(unittest.TestCase):
         self.assertEqual(lock.record_version_number, "r2")
         self.assertEqual(lock.expiry_time, 102)
         self.assertDictEqual(lock.additional_attributes, {"k2": "v2"})
+        # the source item is not mutated
+        self.assertEqual(len(item), 7)
+
+    def test_get_boto_config(self):
+        config = DynamoDBLockClient.get_boto_config(expected_locks=200)
+        self.assertEqual(config.max_pool_connections, 200)
+        self.assertEqual(config.retries["mode"], "adaptive")
+        self.assertFalse(config.endpoint_discovery_enabled)
+        self.assertEqual(DynamoDBLockClient.get_boto_config().max_pool_connections, 50)
 
     # close() tests
 
@@ -333,6 +773,32 @@ class TestDynamoDBLockClient(unittest.TestCase):
         self.lock_client.close(release_locks=True)
         self.assertFalse(lock.unique_identifier in self.lock_client._locks)
 
+    def test_close_releases_locks_in_one_batch(self):
+        batch_execute_statement = self.ddb_table.meta.client.batch_execute_statement
+        batch_execute_statement.side_effect = lambda Statements: {
+            "Responses": [{}, {"Error": {"Code": "ConditionalCheckFailed"}}, {}]
+        }
+        self.ddb_table.get_item = mock.MagicMock("get_item")
+        self.ddb_table.put_item = mock.MagicMock("put_item")
+        self.ddb_table.delete_item = mock.MagicMock("delete_item")
+        locks = [self.lock_client.acquire_lock(key, app_callback=self.app_callback) for key in ("k1", "k2", "k3")]
+        self.lock_client.close(release_locks=True)
+        self.assertEqual(self.lock_client._locks, {})
+        self.assertEqual([lock.status for lock in locks], ["RELEASED"] * 3)
+        self.ddb_table.delete_item.assert_not_called()
+        _, kwargs = batch_execute_statement.call_args
+        self.assertEqual([statement["Parameters"][0]["S"] for statement in kwargs["Statements"]], ["k1", "k2", "k3"])
+        self.assertTrue(kwargs["Statements"][0]["Statement"].startswith('DELETE FROM "DynamoDBLockTable"'))
+
+    def test_close_does_not_wait_for_busy_scheduler(self):
+        resume = threading.Event()
+        self.lock_client._schedule_action(time.monotonic(), resume.wait, 2)
+        time.sleep(50 / 1000)
+        start_time = time.monotonic()
+        self.lock_client.close()
+        self.assertLess(time.monotonic() - start_time, 1)
+        resume.set()
+
     # context-manager methods
 
     def test_lock_with_enter_exit(self):
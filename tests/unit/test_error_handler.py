@@ -1,6 +1,10 @@
 import json
 import logging
 import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from http import HTTPStatus
 from typing import Any, Dict
 from unittest import mock
@@ -8,12 +12,20 @@ from unittest.mock import MagicMock
 
 import pytest
 
+from aws_lambda_powertools.utilities.error_handler import sqs_destination
 from aws_lambda_powertools.utilities.error_handler.constants import DEFAULT_ERROR_MESSAGE, ErrorDestinationEnum
-from aws_lambda_powertools.utilities.error_handler.error_destination_interface import ErrorDestinationInterface
-from aws_lambda_powertools.utilities.error_handler.error_handler import error_handler
+from aws_lambda_powertools.utilities.error_handler.error_destination_interface import (
+    ErrorDestinationInterface,
+    LazyTraceback,
+)
+from aws_lambda_powertools.utilities.error_handler.error_handler import check_params, error_handler
 from aws_lambda_powertools.utilities.error_handler.exception import ErrorHandlerException
 from aws_lambda_powertools.utilities.error_handler.exception_destination import ExceptionDestination
-from aws_lambda_powertools.utilities.error_handler.handler_factory import ErrorHandlerFactory
+from aws_lambda_powertools.utilities.error_handler.handler_factory import (
+    ErrorHandlerFactory,
+    Singleton,
+    default_factory,
+)
 from aws_lambda_powertools.utilities.error_handler.http_response import DEFAULT_HTTP_ERROR_MESSAGE, HttpResponse
 from aws_lambda_powertools.utilities.error_handler.sqs_destination import ERROR_HANDLER_DLQ_URL, SqsDestination
 from aws_lambda_powertools.utilities.typing import LambdaContext
@@ -21,20 +33,21 @@ from aws_lambda_powertools.utilities.typing import LambdaContext
 TRACE = "my trace"
 
 
-def get_logger() -> object:
-    return logging.getLogger("tests")
+@pytest.fixture(autouse=True)
+def reset_sqs_client():
+    # the SQS client is cached at module level - every test patches boto3.client with its own
+    sqs_destination._get_sqs_client.cache_clear()
+    yield
+    sqs_destination._get_sqs_client.cache_clear()
 
 
-def generate_context() -> LambdaContext:
-    context = LambdaContext()
-    context._aws_request_id = "1"
-    context._function_name = "test_function_name"
-    return context
+def get_logger() -> object:
+    return logging.getLogger("tests")
 
 
-def test_error_handler_interface_instantiate():
+def test_error_handler_interface_instantiate(lambda_context):
     with pytest.raises(TypeError) as ex:
-        ErrorDestinationInterface(lambda_context=generate_context(), exception=Exception(), logger=None)
+        ErrorDestinationInterface(lambda_context=lambda_context, exception=Exception(), logger=None)
     assert ex.match("instantiate abstract class ErrorDestinationInterface with abstract methods")
 
 
@@ -45,26 +58,47 @@ def test_factory_singleton():
     fourth = ErrorHandlerFactory()
     fifth = ErrorHandlerFactory()
     assert (first is second) and (third is fourth) and (first is third) and (third is fifth)
-    assert first._error_handlers[ErrorDestinationEnum.SQS] is second._error_handlers[ErrorDestinationEnum.SQS]
+    assert default_factory is first
+    sqs = ErrorDestinationEnum.SQS.ordinal
+    assert first._error_handlers[sqs] is second._error_handlers[sqs]
+
+
+def test_factory_singleton_concurrent_creation():
+    with mock.patch.dict(Singleton._instances, clear=True):
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            factories = list(executor.map(lambda _: ErrorHandlerFactory(), range(32)))
+    assert all(factory is factories[0] for factory in factories)
+
+
+def test_factory_resolves_handlers_on_first_use():
+    sqs = ErrorDestinationEnum.SQS.ordinal
+    with mock.patch.dict(Singleton._instances, clear=True):
+        factory = ErrorHandlerFactory()
+        assert factory._error_handlers[sqs] == (SqsDestination.__module__, "SqsDestination")
+        assert factory.get_handler_class(ErrorDestinationEnum.SQS) is SqsDestination
+        assert factory._error_handlers[sqs] is SqsDestination
 
 
 @mock.patch.dict(os.environ, {ERROR_HANDLER_DLQ_URL: "FAKE_SQS"})
-def test_sqs_destination_build_error_message():
+def test_sqs_destination_build_error_message(lambda_context):
     sqs: SqsDestination = SqsDestination(
-        lambda_context=generate_context(), exception=Exception("I failed"), logger=get_logger(), trace=TRACE
+        lambda_context=lambda_context, exception=Exception("I failed"), logger=get_logger(), trace=TRACE
     )
-    assert sqs._build_error_message() == {
+    expected = {
         "error": "Exception('I failed')",
         "lambda_name": "test_function_name",
         "request_id": "1",
         "traceback": TRACE,
     }
+    assert sqs._build_error_message() == expected
+    # the same bytes as serializing the dict - the layout the message consumers see
+    assert sqs._build_error_json() == json.dumps(expected)
 
 
 @mock.patch.dict(os.environ, {ERROR_HANDLER_DLQ_URL: "FAKE_SQS"})
 def test_factory_initialization_sqs():
     error_handler_factory = ErrorHandlerFactory()
-    assert ErrorDestinationEnum.SQS in error_handler_factory._error_handlers.keys()
+    assert error_handler_factory.get_handler_class(ErrorDestinationEnum.SQS) is SqsDestination
 
     mock_lambda_context = MagicMock()
     mock_lambda_context.function_name = "name"
@@ -79,42 +113,50 @@ def test_factory_initialization_sqs():
     assert isinstance(sqs_error_handler, SqsDestination)
 
 
-def test_factory_initialization_http():
+def test_factory_initialization_http(lambda_context):
     error_handler_factory = ErrorHandlerFactory()
-    assert ErrorDestinationEnum.HTTP_RESPONSE in error_handler_factory._error_handlers.keys()
+    assert error_handler_factory.get_handler_class(ErrorDestinationEnum.HTTP_RESPONSE) is HttpResponse
 
     http_error_handler = ErrorHandlerFactory().get_handler(
         handler_type=ErrorDestinationEnum.HTTP_RESPONSE,
         logger=get_logger(),
         exc=Exception("I failed"),
-        context=generate_context(),
+        context=lambda_context,
         trace=TRACE,
     )
     assert isinstance(http_error_handler, HttpResponse)
 
 
-def test_factory_initialization_assertion():
+def test_factory_initialization_assertion(lambda_context):
     error_handler_factory = ErrorHandlerFactory()
-    assert ErrorDestinationEnum.HTTP_RESPONSE in error_handler_factory._error_handlers.keys()
+    assert error_handler_factory.get_handler_class(ErrorDestinationEnum.HTTP_RESPONSE) is HttpResponse
 
     sqs_error_handler = ErrorHandlerFactory().get_handler(
         handler_type=ErrorDestinationEnum.RAISE_EXCEPTION,
         logger=get_logger(),
         exc=Exception("I failed"),
-        context=generate_context(),
+        context=lambda_context,
         trace=TRACE,
     )
     assert isinstance(sqs_error_handler, ExceptionDestination)
 
 
+def test_check_params():
+    check_params(ErrorDestinationEnum.SQS, get_logger, None)
+    with pytest.raises(ErrorHandlerException, match="destination is not a ErrorDestinationEnum"):
+        check_params("SQS", get_logger, None)
+    with pytest.raises(ErrorHandlerException, match="logger factory is not a Callable"):
+        check_params(ErrorDestinationEnum.SQS, "not a callable", None)
+
+
 @error_handler(logger_factory=get_logger, destination=ErrorDestinationEnum.RAISE_EXCEPTION)
 def handler_exception_type(event: Dict[str, Any], context: LambdaContext) -> Dict[str, Any]:
     raise Exception("test")
 
 
-def test_raise_exception_handler():
+def test_raise_exception_handler(lambda_context):
     with pytest.raises(ErrorHandlerException, match=f"{DEFAULT_ERROR_MESSAGE}. original_error=.*"):
-        handler_exception_type(event={}, context=generate_context())
+        handler_exception_type(event={}, context=lambda_context)
 
 
 @error_handler(logger_factory=get_logger, destination=ErrorDestinationEnum.SQS)
@@ -122,15 +164,15 @@ def handler_sqs_type(event: Dict[str, Any], context: LambdaContext) -> Dict[str,
     raise Exception("test")
 
 
-def test_sqs_handler_missing_env_var(mocker):
+def test_sqs_handler_missing_env_var(mocker, lambda_context):
     with pytest.raises(
         ErrorHandlerException, match="missing environment variable for SQS DLQ destination error handler.*"
     ):
-        handler_sqs_type(event={}, context=generate_context())
+        handler_sqs_type(event={}, context=lambda_context)
 
 
 @mock.patch.dict(os.environ, {ERROR_HANDLER_DLQ_URL: "FAKE_SQS"})
-def test_sqs_handler(mocker):
+def test_sqs_handler(mocker, lambda_context):
     class MockClient:
         @staticmethod
         def send_message(QueueUrl: str, MessageBody: bytes, MessageAttributes: Dict) -> Dict:
@@ -139,11 +181,108 @@ def test_sqs_handler(mocker):
     sqs = mocker.patch("boto3.client")
     sqs.return_value = MockClient()
 
-    handler_sqs_type(event={}, context=generate_context())
+    handler_sqs_type(event={}, context=lambda_context)
 
 
 @mock.patch.dict(os.environ, {ERROR_HANDLER_DLQ_URL: "FAKE_SQS"})
-def test_sqs_handler_failed_sqs_send_message_catch_exception(mocker):
+def test_sqs_client_reused(mocker, lambda_context):
+    sqs = mocker.patch("boto3.client")
+    handler_sqs_type(event={}, context=lambda_context)
+    handler_sqs_type(event={}, context=lambda_context)
+    sqs.assert_called_once_with("sqs")
+    assert sqs.return_value.send_message.call_count == 2
+
+
+@mock.patch.dict(os.environ, {ERROR_HANDLER_DLQ_URL: "FAKE_SQS"})
+def test_sqs_handler_sends_traceback(mocker, lambda_context):
+    sqs = mocker.patch("boto3.client")
+    handler_sqs_type(event={}, context=lambda_context)
+    _, kwargs = sqs.return_value.send_message.call_args
+    trace = json.loads(kwargs["MessageBody"])["traceback"]
+    assert trace.startswith("Traceback (most recent call last):")
+    assert "Exception: test" in trace
+
+
+@mock.patch.dict(os.environ, {ERROR_HANDLER_DLQ_URL: "FAKE_SQS"})
+def test_sqs_handler_batches_concurrent_errors(mocker, lambda_context):
+    in_flight = threading.Event()
+    resume = threading.Event()
+    sqs = mocker.patch("boto3.client")
+    sqs.return_value.send_message.side_effect = lambda **kwargs: in_flight.set() or resume.wait(5)
+    sqs.return_value.send_message_batch.return_value = {"Successful": [], "Failed": []}
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        futures = [executor.submit(handler_sqs_type, event={}, context=lambda_context)]
+        assert in_flight.wait(5)
+        futures += [executor.submit(handler_sqs_type, event={}, context=lambda_context) for _ in range(4)]
+        deadline = time.monotonic() + 5
+        while sqs_destination._ERROR_QUEUE._queue.qsize() < 4 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        resume.set()
+        for future in futures:
+            future.result(timeout=5)
+    sqs.return_value.send_message.assert_called_once()
+    _, kwargs = sqs.return_value.send_message_batch.call_args
+    assert kwargs["QueueUrl"] == "FAKE_SQS"
+    assert [entry["Id"] for entry in kwargs["Entries"]] == ["0", "1", "2", "3"]
+
+
+@mock.patch.dict(os.environ, {ERROR_HANDLER_DLQ_URL: "FAKE_SQS"})
+def test_sqs_batch_failed_entries(mocker):
+    sqs = mocker.patch("boto3.client")
+    sqs.return_value.send_message_batch.return_value = {
+        "Failed": [{"Id": "1", "Code": "InternalError", "SenderFault": False}]
+    }
+    entries = [sqs_destination._QueuedError("FAKE_SQS", body, {}) for body in ("a", "b")]
+    sqs_destination._ErrorQueue._send("FAKE_SQS", entries)
+    assert all(entry.done.is_set() for entry in entries)
+    assert entries[0].error is None
+    assert isinstance(entries[1].error, ErrorHandlerException)
+
+
+def test_lazy_traceback_formats_once():
+    try:
+        raise ValueError("lazy")
+    except ValueError:
+        trace = LazyTraceback(sys.exc_info())
+    with mock.patch("traceback.format_exception", return_value=["formatted"]) as format_exception:
+        assert str(trace) == "formatted"
+        assert str(trace) == "formatted"
+    format_exception.assert_called_once()
+
+
+@mock.patch.dict(os.environ, {ERROR_HANDLER_DLQ_URL: "FAKE_SQS"})
+def test_build_error_json_non_ascii(lambda_context):
+    sqs = SqsDestination(
+        lambda_context=lambda_context, exception=Exception('é "quoted"'), logger=get_logger(), trace="line 1\n"
+    )
+    assert sqs._build_error_json() == json.dumps(sqs._build_error_message())
+    assert "\\u00e9" in sqs._build_error_json()
+
+
+def test_destination_trace_is_str(lambda_context):
+    try:
+        raise ValueError("lazy")
+    except ValueError:
+        trace = LazyTraceback(sys.exc_info())
+    destination = HttpResponse(
+        lambda_context=lambda_context, exception=Exception("I failed"), logger=get_logger(), trace=trace
+    )
+    assert isinstance(destination._trace, str)
+    assert "ValueError: lazy" in json.loads(json.dumps(destination._trace))
+
+
+def test_sqs_client_cached_per_region(mocker):
+    sqs = mocker.patch("boto3.client")
+    assert sqs_destination._get_sqs_client("eu-west-1") is sqs_destination._get_sqs_client("eu-west-1")
+    sqs_destination._get_sqs_client("us-east-1")
+    assert sqs.call_args_list == [
+        mock.call("sqs", region_name="eu-west-1"),
+        mock.call("sqs", region_name="us-east-1"),
+    ]
+
+
+@mock.patch.dict(os.environ, {ERROR_HANDLER_DLQ_URL: "FAKE_SQS"})
+def test_sqs_handler_failed_sqs_send_message_catch_exception(mocker, lambda_context):
     # in this test we make bob3 sqs send_message raise an exception and we want to verify
     # that the handler catches the error - so no exception is raised at all
     class MockClient:
@@ -154,20 +293,7 @@ def test_sqs_handler_failed_sqs_send_message_catch_exception(mocker):
     sqs = mocker.patch("boto3.client")
     sqs.return_value = MockClient()
 
-    handler_sqs_type(event={}, context=generate_context())
-
-
-@error_handler(logger_factory=get_logger, destination=ErrorDestinationEnum.HTTP_RESPONSE)
-def handler_http_type(event: Dict[str, Any], context: LambdaContext) -> Dict[str, Any]:
-    raise Exception("test")
-
-
-def test_http_handler(mocker):
-    response: Dict = handler_http_type(event={}, context=generate_context())
-    assert response["statusCode"] == HTTPStatus.INTERNAL_SERVER_ERROR
-    assert response["headers"]["Content-Type"] == "application/json"
-    body_dict = json.loads(response["body"])
-    assert body_dict["error"] == DEFAULT_HTTP_ERROR_MESSAGE
+    handler_sqs_type(event={}, context=lambda_context)
 
 
 class CustomErrorHandler(ErrorDestinationInterface):
@@ -175,24 +301,95 @@ class CustomErrorHandler(ErrorDestinationInterface):
         return "test_passed"
 
 
-@error_handler(logger_factory=get_logger, destination=ErrorDestinationEnum.CUSTOM, custom_handler=CustomErrorHandler)
-def handler_custom_type(event: Dict[str, Any], context: LambdaContext) -> Dict[str, Any]:
-    raise Exception("test")
+@pytest.fixture(
+    scope="module",
+    params=[(ErrorDestinationEnum.HTTP_RESPONSE, None), (ErrorDestinationEnum.CUSTOM, CustomErrorHandler)],
+    ids=["http_response", "custom"],
+)
+def destination_handler(request):
+    # decorated once per destination and shared by every test of this module that requests it
+    destination, custom_handler = request.param
 
+    @error_handler(logger_factory=get_logger, destination=destination, custom_handler=custom_handler)
+    def handler_failing(event: Dict[str, Any], context: LambdaContext) -> Dict[str, Any]:
+        raise Exception("test")
 
-def test_custom_handler(mocker):
-    response: Dict = handler_custom_type(event={}, context=generate_context())
-    assert response == "test_passed"
+    return destination, handler_failing
 
 
-@error_handler(logger_factory=get_logger, destination=ErrorDestinationEnum.SQS, custom_handler=CustomErrorHandler)
-def handler_invalid_definition_custom_type(event: Dict[str, Any], context: LambdaContext) -> Dict[str, Any]:
-    raise Exception("test")
+def test_destination_handler(destination_handler, lambda_context):
+    destination, handler = destination_handler
+    response = handler(event={}, context=lambda_context)
+    if destination == ErrorDestinationEnum.CUSTOM:
+        assert response == "test_passed"
+        return
+
+    assert response["statusCode"] == HTTPStatus.INTERNAL_SERVER_ERROR
+    assert response["headers"]["Content-Type"] == "application/json"
+    body_dict = json.loads(response["body"])
+    assert body_dict["error"] == DEFAULT_HTTP_ERROR_MESSAGE
+    assert response["body"] == json.dumps({"error": DEFAULT_HTTP_ERROR_MESSAGE})
 
 
 def test_invalid_definition_custom_handler(mocker):
+    # the arguments are checked when decorating
     with pytest.raises(
         ErrorHandlerException,
         match="custom destination must be used in conjunction only with ErrorDestinationEnum.CUSTOM",
     ):
-        handler_invalid_definition_custom_type(event={}, context=generate_context())
+
+        @error_handler(
+            logger_factory=get_logger, destination=ErrorDestinationEnum.SQS, custom_handler=CustomErrorHandler
+        )
+        def handler_invalid_definition_custom_type(event: Dict[str, Any], context: LambdaContext) -> Dict[str, Any]:
+            raise Exception("test")
+
+
+def test_error_handler_success_path(mocker, lambda_context):
+    logger_factory = mocker.MagicMock(name="logger_factory")
+
+    @error_handler(logger_factory=logger_factory, destination=ErrorDestinationEnum.HTTP_RESPONSE)
+    def handler_ok(event: Dict[str, Any], context: LambdaContext) -> Dict[str, Any]:
+        return {"ok": True}
+
+    assert handler_ok(event={}, context=lambda_context) == {"ok": True}
+    assert handler_ok.__name__ == "handler_ok"
+    logger_factory.assert_not_called()
+
+
+def test_error_handler_checks_params_only_when_decorating(mocker, lambda_context):
+    check = mocker.patch("aws_lambda_powertools.utilities.error_handler.error_handler.check_params")
+
+    @error_handler(logger_factory=get_logger, destination=ErrorDestinationEnum.HTTP_RESPONSE)
+    def handler_failing(event: Dict[str, Any], context: LambdaContext) -> Dict[str, Any]:
+        raise Exception("test")
+
+    handler_failing(event={}, context=lambda_context)
+    handler_failing(event={}, context=lambda_context)
+    check.assert_called_once()
+
+
+@pytest.mark.parametrize("per_request_logger, expected_calls", [(False, 1), (True, 2)])
+def test_error_handler_logger_factory_calls(mocker, per_request_logger, expected_calls, lambda_context):
+    logger_factory = mocker.MagicMock(name="logger_factory")
+
+    @error_handler(
+        logger_factory=logger_factory,
+        destination=ErrorDestinationEnum.HTTP_RESPONSE,
+        per_request_logger=per_request_logger,
+    )
+    def handler_failing(event: Dict[str, Any], context: LambdaContext) -> Dict[str, Any]:
+        raise Exception("test")
+
+    handler_failing(event={}, context=lambda_context)
+    handler_failing(event={}, context=lambda_context)
+    assert logger_factory.call_count == expected_calls
+
+
+@pytest.mark.parametrize("destination_class", [SqsDestination, HttpResponse, ExceptionDestination])
+@mock.patch.dict(os.environ, {ERROR_HANDLER_DLQ_URL: "FAKE_SQS"})
+def test_destinations_have_no_instance_dict(destination_class, lambda_context):
+    destination = destination_class(
+        lambda_context=lambda_context, exception=Exception("I failed"), logger=get_logger(), trace=TRACE
+    )
+    assert not hasattr(destination, "__dict__")
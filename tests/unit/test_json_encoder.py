@@ -3,7 +3,8 @@ import json
 
 import pytest
 
-from aws_lambda_powertools.shared.json_encoder import Encoder
+from aws_lambda_powertools.shared import json_encoder
+from aws_lambda_powertools.shared.json_encoder import Encoder, dumps
 
 
 def test_jsonencode_decimal():
@@ -22,3 +23,24 @@ def test_jsonencode_calls_default():
 
     with pytest.raises(TypeError):
         json.dumps({"val": CustomClass()}, cls=Encoder)
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_dumps_compact_with_and_without_orjson(monkeypatch, use_orjson):
+    if not use_orjson:
+        monkeypatch.setattr(json_encoder, "HAS_ORJSON", False)
+    elif not json_encoder.HAS_ORJSON:
+        pytest.skip("orjson is not installed")
+    assert dumps({"error": "Exception('é')", "traceback": 'line "1"\n'}) == (
+        '{"error":"Exception(\'é\')","traceback":"line \\"1\\"\\n"}'
+    )
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_dumps_sort_keys_with_and_without_orjson(monkeypatch, use_orjson):
+    if not use_orjson:
+        monkeypatch.setattr(json_encoder, "HAS_ORJSON", False)
+    elif not json_encoder.HAS_ORJSON:
+        pytest.skip("orjson is not installed")
+    assert dumps({"b": 1, "a": {"d": 2, "c": 3}}) == '{"b":1,"a":{"d":2,"c":3}}'
+    assert dumps({"b": 1, "a": {"d": 2, "c": 3}}, sort_keys=True) == '{"a":{"c":3,"d":2},"b":1}'
@@ -1,4 +1,5 @@
 import hashlib
+import sys
 
 from aws_lambda_powertools.utilities.obfuscater.filtering_mode import FilterModes
 from aws_lambda_powertools.utilities.obfuscater.obfuscator import Obfuscator
@@ -52,3 +53,60 @@ def test_obfuscate_with_callable():
     obfuscated_object = obfuscater.obfuscate(INPUT_DICT, ["name", "email"])
     assert obfuscated_object.get("name") == md5(INPUT_DICT.get("name"))
     assert obfuscated_object.get("email") == md5(INPUT_DICT.get("email"))
+
+
+def test_obfuscate_keeps_lists_and_input():
+    obfuscater = Obfuscator(FilterModes.BlackList)
+    obfuscated_object = obfuscater.obfuscate(INPUT_DICT2, ["type"])
+    assert obfuscated_object == {
+        "pets": [
+            {"type": "***", "legs": 4, "age": 15},
+            {"type": "***", "legs": 4, "age": 2},
+        ]
+    }
+    assert INPUT_DICT2["pets"][0]["type"] == "cat"
+
+
+def test_obfuscate_nested_matches_once():
+    def tag(value):
+        return f"<{value}>"
+
+    obfuscater = Obfuscator(FilterModes.BlackList, tag)
+    obfuscated_object = obfuscater.obfuscate(INPUT_DICT2, ["pets", "type"])
+    assert obfuscated_object["pets"][0] == {"type": "<cat>", "legs": "<4>", "age": "<15>"}
+
+
+def test_obfuscate_white_list():
+    obfuscater = Obfuscator(FilterModes.WhiteList)
+    obfuscated_object = obfuscater.obfuscate(INPUT_DICT, ["id", "location"])
+    assert obfuscated_object == {
+        "id": 111,
+        "name": "***********",
+        "email": "*********************",
+        "location": {"country": "israel", "city": "Tel Aviv"},
+    }
+
+
+def test_obfuscate_deeper_than_recursion_limit():
+    depth = sys.getrecursionlimit() + 100
+    deep = leaf = {}
+    for _ in range(depth):
+        leaf["next"] = {}
+        leaf = leaf["next"]
+    leaf["name"] = "random_name"
+
+    obfuscater = Obfuscator(FilterModes.BlackList)
+    obfuscated_object = obfuscater.obfuscate(deep, ["name"])
+    path = ("next",) * depth + ("name",)
+    assert obfuscater._flatten_json(obfuscated_object) == {path: "***********"}
+
+
+def test_obfuscate_with_blake2b():
+    def blake2b(string):
+        return hashlib.blake2b(string.encode("utf-8"), digest_size=16).hexdigest()
+
+    obfuscater = Obfuscator(FilterModes.BlackList, Obfuscator.blake2b)
+    obfuscated_object = obfuscater.obfuscate(INPUT_DICT, ["name", "email"])
+    assert obfuscated_object.get("name") == blake2b(INPUT_DICT.get("name"))
+    assert obfuscated_object.get("email") == blake2b(INPUT_DICT.get("email"))
+    assert len(obfuscated_object.get("name")) == len(hashlib.md5().hexdigest())